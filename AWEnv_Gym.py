@@ -10,11 +10,12 @@ from collections import OrderedDict
 
 from Game.Game import Game
 from Game.CO import BaseCO
-from Game.Action import Action, ActionEnd, ActionMove, ActionMoveCombineLoad, ActionDirectAttack, ActionIndirectAttack, ActionCapture, ActionBuild, ActionRepair, ActionUnload, ActionCOP, ActionSCOP
+from Game.Action import Action, ActionEnd, ActionMoveCombineLoad, ActionDirectAttack, ActionIndirectAttack, ActionCapture, ActionBuild, ActionRepair, ActionUnload, ActionCOP, ActionSCOP
 from Agent import Agent
 from Game.Terrain import Property, standard_terrain
 from Game.Unit import standard_units
 from Game.MoveType import MoveType
+from Game.MoveGenerator import LegalAction, legal_actions, create_action
 
 class AWEnv_Gym(Env):
     metadata = {"render_modes": ["none", "text", "raw"]}
@@ -60,6 +61,7 @@ class AWEnv_Gym(Env):
         )
 
     possible_directions = [(-1, 0), (1, 0), (0, 1), (0, -1)]
+    direction_indices = {direction: i for i, direction in enumerate(possible_directions)}
 
     def __init__(self, env_config):
         super().__init__()
@@ -136,7 +138,23 @@ class AWEnv_Gym(Env):
         self.unit_indices = {unit_type: i for i, unit_type in enumerate(standard_units)}
         self.move_type_indices = {move_type: i for i, move_type in enumerate(MoveType)}
 
+        # Terrain never changes during a game, so its channels are built once
+        self.terrain_type_observation = np.zeros((len(self.terrain_indices), self.rows, self.cols), dtype=np.float32)
+        self.terrain_stars_observation = (self.game.state.terrain_defense / 5).astype(np.float32)
+        for r, row in enumerate(self.game.state.terrain):
+            for c, terrain in enumerate(row):
+                if isinstance(terrain, Property):
+                    self.terrain_stars_observation[r, c] = 0
+                else:
+                    self.terrain_type_observation[self.terrain_indices[type(terrain)], r, c] = 1
+
         self.update_valid_actions()
+        self.game.state.drain_changes()
+
+        # Every episode starts from the same position, so reset restores this instead of reloading the map
+        self.initial_state = self.game.state.snapshot()
+        self.initial_action_mask = {action_type: action_array.copy() for action_type, action_array in self.action_mask.items()}
+        self.initial_observation = self.get_observation(self.game.get_current_player())
     
     def generate_game(self, co_cls, map, strict):
         cos = {
@@ -159,8 +177,31 @@ class AWEnv_Gym(Env):
             action_type = a_type
 
         sub_action_id = action_id - self.action_start_ids[action_type]
-        action_args = np.unravel_index(sub_action_id, self.actions[action_type])
-        return self._valid_actions[action_type][action_args]
+        action_args = tuple(int(arg) for arg in np.unravel_index(sub_action_id, self.actions[action_type]))
+        if not self.action_mask[action_type][action_args]:
+            return None
+
+        return self.create_action(action_type, action_args)
+
+    def create_action(self, action_type, action_args):
+        if action_type in (ActionEnd, ActionCOP, ActionSCOP):
+            return create_action(LegalAction(action_type, None, None, None, None))
+
+        position = action_args[:2]
+        if action_type is ActionBuild:
+            return create_action(LegalAction(ActionBuild, position, None, None, standard_units[action_args[2]]))
+
+        if action_type is ActionIndirectAttack:
+            target = (position[0] + action_args[2] - self.max_attack, position[1] + action_args[3] - self.max_attack)
+            return create_action(LegalAction(ActionIndirectAttack, position, position, target, None))
+
+        destination = (position[0] + action_args[2] - self.max_move, position[1] + action_args[3] - self.max_move)
+        target = None
+        if len(action_args) > 4:
+            direction = self.possible_directions[action_args[4]]
+            target = (destination[0] + direction[0], destination[1] + direction[1])
+        extra = action_args[5] if action_type is ActionUnload else None
+        return create_action(LegalAction(action_type, position, destination, target, extra))
 
     def step(self, action):
         if isinstance(action, list):
@@ -183,7 +224,7 @@ class AWEnv_Gym(Env):
             self.render(self.render_mode)
             print(self.game.state.get_player_stats())
 
-        self.update_valid_actions()
+        self.update_valid_actions(action, self.game.state.drain_changes())
 
         new_player = self.game.get_current_player()
         observation = self.get_observation(new_player)
@@ -195,13 +236,11 @@ class AWEnv_Gym(Env):
         return observation, reward, done, info
 
     def get_observation(self, player):
-        height = self.rows
-        width = self.cols
         players = len(self.players)
 
         observation = {
-            "terrain_type": np.zeros((len(self.terrain_indices), self.rows, self.cols), dtype=np.float32),
-            "terrain_stars": np.zeros((self.rows, self.cols), dtype=np.float32),
+            "terrain_type": self.terrain_type_observation.copy(),
+            "terrain_stars": self.terrain_stars_observation.copy(),
             "property_type": np.zeros((3, len(self.property_indices), self.rows, self.cols), dtype=np.float32),
             "property_capture": np.zeros((3, len(self.property_indices), self.rows, self.cols), dtype=np.float32), # [0, 20] for each property type, for each player
             "unit_type": np.zeros((2, len(self.unit_indices), self.rows, self.cols), dtype=np.float32),
@@ -218,37 +257,26 @@ class AWEnv_Gym(Env):
             "day": np.zeros((1,), dtype=np.float32)
         }
 
-        get_terrain = self.game.state.get_terrain
-        get_property = self.game.state.get_property
-        get_unit = self.game.state.get_unit
-
-        observation['day'][0] = (self.game.state.current_day // 10) / 10
-
-        for r in range(height):
-            for c in range(width):
-                position = (r, c)
-                terrain = get_terrain(position)
-                if not isinstance(terrain, Property):
-                    observation['terrain_type'][self.terrain_indices[type(terrain)], r, c] = 1
-                    observation['terrain_stars'][r, c] = terrain.defense / 5
-
-                for p in self.players:
-                    p_id = 0 if p is player else 1
-                    unit = get_unit(position, owner=p)
-                    if unit is not None:
-                        observation['unit_type'][p_id, self.unit_indices[type(unit)], r, c] = 1
-                        observation['unit_health'][p_id, r, c] = unit.get_display_health() / 10
-                        observation['unit_fuel'][p_id, r, c] = unit.fuel / unit.max_fuel
-                        observation['unit_ammo'][p_id, r, c] = unit.ammo / unit.max_ammo if unit.max_ammo > 0 else 1
-                        observation['unit_available'][p_id, r, c] = 1 if unit.available else 0
-                        for unit_type in standard_units:
-                            observation['unit_attack'][p_id, self.unit_indices[unit_type], r, c] = unit.attack_table.get(unit_type, (0, 0))[0] / 200
-
-                property = get_property(position)
-                if property is not None:
-                    p_id = 0 if property.owner is player else 2 if property.owner == 'N' else 1
-                    observation['property_type'][p_id, self.property_indices[type(property)], r, c] = 1
-                    observation['property_capture'][p_id, self.property_indices[type(property)], r, c] = property.capture_amount / 20
+        state = self.game.state
+        unit_store = state.unit_store
+
+        observation['day'][0] = (state.current_day // 10) / 10
+
+        # Unit channels are scattered from the unit store arrays
+        slots, owners, unit_types, rows, cols = unit_store.get_units_array()
+        p_ids = np.where(owners == unit_store.owner_index[player], 0, 1)
+        max_ammo = unit_store.type_max_ammo[unit_types]
+        observation['unit_type'][p_ids, unit_types, rows, cols] = 1
+        observation['unit_health'][p_ids, rows, cols] = -(-unit_store.health[slots] // 10) / 10
+        observation['unit_fuel'][p_ids, rows, cols] = unit_store.fuel[slots] / unit_store.type_max_fuel[unit_types]
+        observation['unit_ammo'][p_ids, rows, cols] = np.divide(unit_store.ammo[slots], max_ammo, out=np.ones(len(slots)), where=max_ammo > 0)
+        observation['unit_available'][p_ids, rows, cols] = unit_store.available[slots]
+        observation['unit_attack'][p_ids[:, None], np.arange(len(self.unit_indices))[None, :], rows[:, None], cols[:, None]] = unit_store.type_attack[unit_types] / 200
+
+        for (r, c), property in state.get_all_properties().items():
+            p_id = 0 if property.owner is player else 2 if property.owner == 'N' else 1
+            observation['property_type'][p_id, self.property_indices[type(property)], r, c] = 1
+            observation['property_capture'][p_id, self.property_indices[type(property)], r, c] = property.capture_amount / 20
         
         for p in self.players:
             p_id = 0 if p is player else 1
@@ -301,133 +329,92 @@ class AWEnv_Gym(Env):
         action_masks = np.concatenate([self.action_mask[action_type].flatten() for action_type in self.actions])
         return action_masks
     
-    def update_valid_actions(self):
-        # Construct action masks that match the shapes defined by self.actions
-        valid_actions = {action_type: {} for action_type in self.actions}
-        for action_array in self.action_mask.values():
-            action_array.fill(False)
-
-        current_state = self.game.state
-        all_units = current_state.get_all_units()
-        current_player = self.game.get_current_player()
-        enemy_units = {position: unit for position, unit in all_units.items() if unit.owner != current_player}
-
-        valid_actions[ActionEnd][(0,)] = ActionEnd()
-        self.action_mask[ActionEnd][(0,)] = True
-
-        cop_action = ActionCOP()
-        if cop_action.validate(current_state):
-            valid_actions[ActionCOP][(0,)] = cop_action
-            self.action_mask[ActionCOP][(0,)] = True
-
-        scop_action = ActionSCOP()
-        if scop_action.validate(current_state):
-            valid_actions[ActionSCOP][(0,)] = scop_action
-            self.action_mask[ActionSCOP][(0,)] = True
-
-        possible_directions = self.possible_directions
-        
-        for position, unit in all_units.items():
-            if unit.owner != current_player or not unit.available:
+    # Legal actions are only recorded in the action masks, an action's mask index holds everything needed to build it.
+    # Given the last action and the state changes it made, only the entries it could have affected are recomputed.
+    def update_valid_actions(self, action=None, changes=None):
+        state = self.game.state
+        if action is None or changes is None or changes.full or "current_player" in changes.scalars or isinstance(action, (ActionEnd, ActionCOP, ActionSCOP)):
+            for action_array in self.action_mask.values():
+                action_array.fill(False)
+            self.set_action_mask(legal_actions(state))
+            return
+
+        positions = self.get_affected_positions(changes)
+        for action_type, action_array in self.action_mask.items():
+            if action_type in (ActionEnd, ActionCOP, ActionSCOP):
+                action_array.fill(False)
+                continue
+            for r, c in positions:
+                action_array[r, c] = False
+        self.set_action_mask(legal_actions(state, action_types=[ActionEnd, ActionCOP, ActionSCOP]))
+        self.set_action_mask(legal_actions(state, positions=positions))
+
+    # Positions of the current player's units and properties whose legal actions may have changed within the turn.
+    # A unit's actions only look at spaces within its move range plus one, or its attack range, of where it stands.
+    # Repairs and builds also depend on funds.
+    def get_affected_positions(self, changes):
+        state = self.game.state
+        current_player = state.get_current_player()
+        dirty_cells = changes.cells
+        funds_changed = "funds" in changes.scalars
+
+        positions = set(dirty_cells)
+        for position, unit in state.get_all_units(owner=current_player).items():
+            if position in positions or not unit.available:
+                continue
+            if funds_changed and unit.can_repair:
+                positions.add(position)
                 continue
-
             r, c = position
+            radius = max(unit.move + 1, max(unit.range))
+            for dirty_r, dirty_c in dirty_cells:
+                if abs(dirty_r - r) + abs(dirty_c - c) <= radius:
+                    positions.add(position)
+                    break
+
+        if funds_changed:
+            positions.update(state.get_all_properties(owner=current_player))
+        return positions
+
+    def set_action_mask(self, actions):
+        action_mask = self.action_mask
+        max_move = self.max_move
+        max_attack = self.max_attack
+        direction_indices = self.direction_indices
+        unit_indices = self.unit_indices
+
+        for action_type, position, destination, target, extra in actions:
+            if action_type in (ActionEnd, ActionCOP, ActionSCOP):
+                action_mask[action_type][0] = True
+                continue
 
-            #Indirect Attack
-            if 1 not in unit.range:
-                for attack_position_r, attack_position_c in enemy_units:
-                    attack_offset_r = attack_position_r - r
-                    attack_offset_c = attack_position_c - c
-
-                    attack_offset_id_r = attack_offset_r + self.max_attack
-                    attack_offset_id_c = attack_offset_c + self.max_attack
-
-                    indirect_attack_action = ActionIndirectAttack(position, (attack_offset_r, attack_offset_c))
-                    if indirect_attack_action.validate(current_state):
-                        action_args = (r, c, attack_offset_id_r, attack_offset_id_c)
-                        valid_actions[ActionIndirectAttack][action_args] = indirect_attack_action
-                        self.action_mask[ActionIndirectAttack][action_args] = True
-
-            for unblocked_position_r, unblocked_position_c in current_state._unblocked_spaces[position]:
-                move_offset_r = unblocked_position_r - r
-                move_offset_c = unblocked_position_c - c
-            
-                move_action = ActionMove(unit_position=position, offset=(move_offset_r, move_offset_c))
-                if not move_action.validate(current_state):
-                    continue
-
+            r, c = position
+            if action_type is ActionBuild:
+                action_mask[ActionBuild][r, c, unit_indices[extra]] = True
+            elif action_type is ActionIndirectAttack:
+                action_mask[ActionIndirectAttack][r, c, target[0] - r + max_attack, target[1] - c + max_attack] = True
+            else:
                 # Avoid negative indices
-                move_id_r = move_offset_r + self.max_move
-                move_id_c = move_offset_c + self.max_move
-                #Move/Combine/Load
-                move_combine_load_action = ActionMoveCombineLoad(move_action=move_action)
-                if move_combine_load_action.validate(current_state):
-                    action_args = (r, c, move_id_r, move_id_c)
-                    valid_actions[ActionMoveCombineLoad][action_args] = move_combine_load_action
-                    self.action_mask[ActionMoveCombineLoad][action_args] = True
-                
-                #Direct Attack
-                if 1 in unit.range:
-                    for direction_index, direction in enumerate(possible_directions):
-                        direct_attack_action = ActionDirectAttack(move_action=move_action, attack_offset=direction)
-                        if direct_attack_action.attack_target not in enemy_units:
-                            continue
-
-                        if direct_attack_action.validate(current_state):
-                            action_args = (r, c, move_id_r, move_id_c, direction_index)
-                            valid_actions[ActionDirectAttack][action_args] = direct_attack_action
-                            self.action_mask[ActionDirectAttack][action_args] = True
-                
-                #Capture
-                if unit.can_capture:
-                    capture_action = ActionCapture(move_action=move_action)
-                    if capture_action.validate(current_state):
-                        action_args = (r, c, move_id_r, move_id_c)
-                        valid_actions[ActionCapture][action_args] = capture_action
-                        self.action_mask[ActionCapture][action_args] = True
-                        
-
-                #Repair
-                if unit.can_repair:
-                    for direction_index, direction in enumerate(possible_directions):
-                        repair_action = ActionRepair(move_action=move_action, repair_offset=direction)
-                        if repair_action.validate(current_state):
-                            action_args = (r, c, move_id_r, move_id_c, direction_index)
-                            valid_actions[ActionRepair][action_args] = repair_action
-                            self.action_mask[ActionRepair][action_args] = True
-
-                #Unload
-                for idx in range(len(unit.in_load)):
-                    for direction_index, direction in enumerate(possible_directions):
-                        unload_action = ActionUnload(move_action=move_action, unload_offset=direction, idx=idx)
-                        if unload_action.unload_position in all_units:
-                            continue
-                        if unload_action.validate(current_state):
-                            action_args = (r, c, move_id_r, move_id_c, direction_index, idx)
-                            valid_actions[ActionUnload][action_args] = unload_action
-                            self.action_mask[ActionUnload][action_args] = True
-
-        for position, property in current_state.get_all_properties(owner=current_player).items(): 
-            r, c = position                  
-            #Build
-            for unit_type in property.buildables:
-                idx = self.unit_indices[unit_type]
-                build_action = ActionBuild(position, unit_type.code)
-                if build_action.validate(current_state):
-                    action_args = (r, c, idx)
-                    valid_actions[ActionBuild][action_args] = build_action
-                    self.action_mask[ActionBuild][action_args] = True
-
-        # Flatten the action masks to match the actual flat action space
-        self._valid_actions = valid_actions 
+                move_id_r = destination[0] - r + max_move
+                move_id_c = destination[1] - c + max_move
+                if action_type is ActionMoveCombineLoad or action_type is ActionCapture:
+                    action_mask[action_type][r, c, move_id_r, move_id_c] = True
+                else:
+                    direction_index = direction_indices[(target[0] - destination[0], target[1] - destination[1])]
+                    if action_type is ActionUnload:
+                        action_mask[ActionUnload][r, c, move_id_r, move_id_c, direction_index, extra] = True
+                    else:
+                        action_mask[action_type][r, c, move_id_r, move_id_c, direction_index] = True
 
     def reset(self, seed=0, return_info=False, options=None):
-        strict = self.env_config.get('strict', True)
-        self.game = self.env_config.get('game') or self.generate_game(self.co_cls, self.map, strict)
-        current_player = self.game.get_current_player()
+        self.game.state.restore(self.initial_state)
+        self.game.clear_history()
 
-        self.update_valid_actions()
-        return self.get_observation(current_player)
+        for action_type, action_array in self.action_mask.items():
+            np.copyto(action_array, self.initial_action_mask[action_type])
+        self.game.state.drain_changes()
+
+        return {key: value.copy() for key, value in self.initial_observation.items()}
     
     def render(self, mode, **kwargs):
         if mode == "text":
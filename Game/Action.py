@@ -1,6 +1,5 @@
 from util import calculate_damage, parse_direction
-from Game.Terrain import Property, TerrainAirport, TerrainPort, TerrainCommTower
-from Game.MoveType import MoveType
+from Game.Terrain import Property, TerrainCommTower
 import math
 
 class Action:
@@ -32,6 +31,10 @@ class Action:
         else:
             return invalid_reason
 
+    # Positions whose units or properties may change when the action executes
+    def affected_positions(self):
+        return set()
+
     def __str__(self) -> str:
         return "Do Nothing"
 
@@ -61,48 +64,31 @@ class ActionEnd(Action):
             unit.change_fuel(-unit.daily_fuel)
 
     def daily_income(self, player):
-        for row in self.state.terrain:
-            for terrain in row:
-                if isinstance(terrain, Property) and terrain.owner == player:
-                    self.state.funds[terrain.owner] += terrain.income
+        self.state.funds[player] += self.state.get_income(player)
 
     def daily_unit_reset(self, player):
         for unit in self.state.get_all_units(player).values():
             unit.available = True
     
+    # Only the player's units standing on their own properties are visited, in row-major order since funds can run out
     def daily_unit_repair_resupply(self, player):
-        for r in range(self.state.map_height):
-            for c in range(self.state.map_width):
-                repair = False
-                terrain = self.state.get_terrain((r, c))
-                unit = self.state.get_unit((r, c), owner=player)
-                if unit is None:
-                    continue
-            
-                if isinstance(terrain, Property):
-                    if terrain.owner is not player:
-                        continue
-                    if isinstance(terrain, TerrainAirport):
-                        if unit.move_type is MoveType.AIR:
-                            repair = True
-                    elif isinstance(terrain, TerrainPort):
-                        if unit.move_type is MoveType.SEA or unit.move_type is MoveType.LANDER:
-                            repair = True
-                    else:
-                        if unit.move_type is MoveType.BOOT or unit.move_type is MoveType.FOOT or unit.move_type is MoveType.PIPE or unit.move_type is MoveType.THREADS or unit.move_type is MoveType.TIRES:
-                            repair = True
-
-                if repair:
-                    unit.change_ammo(unit.max_ammo)
-                    unit.change_fuel(unit.max_fuel)
-
-                    repair_amount = max(0, min(2, 10 - unit.get_display_health()))
-                    cost = (repair_amount / 10) * unit.cost
-                    if self.state.funds[player] < cost:
-                        return
-
-                    self.state.funds[player] -= cost
-                    unit.change_health(repair_amount * 10)
+        properties = self.state.get_all_properties(player)
+        repairable_units = sorted(
+            [(position, unit) for position, unit in self.state.get_all_units(player).items() if position in properties and unit.move_type in properties[position].repairs],
+            key=lambda repairable_unit: repairable_unit[0]
+        )
+
+        for position, unit in repairable_units:
+            unit.change_ammo(unit.max_ammo)
+            unit.change_fuel(unit.max_fuel)
+
+            repair_amount = max(0, min(2, 10 - unit.get_display_health()))
+            cost = (repair_amount / 10) * unit.cost
+            if self.state.funds[player] < cost:
+                return
+
+            self.state.funds[player] -= cost
+            unit.change_health(repair_amount * 10)
     
     def reset_powers(self, player):
         co = self.state.get_co(player)
@@ -111,6 +97,10 @@ class ActionEnd(Action):
         if co.scop_applied:
             co.reset_scop(self.state)
 
+    def affected_positions(self):
+        next_player = self.state.players[(self.state.current_player + 1) % len(self.state.players)]
+        return set(self.state.get_all_units(next_player))
+
     def __str__(self) -> str:
         return "End Turn"
 
@@ -165,6 +155,9 @@ class ActionMove(Action):
         
         self.state.set_unit(self.unit_to_move, self.destination)
     
+    def affected_positions(self):
+        return {self.unit_position, self.destination}
+
     def __str__(self) -> str:
         return f"Move unit at {self.unit_position} to {self.destination}"
 
@@ -226,6 +219,9 @@ class ActionMoveCombineLoad(Action):
         
         self.unit_to_move.available = False
     
+    def affected_positions(self):
+        return self.move_action.affected_positions()
+
     def __str__(self) -> str:
         combine_or_load = ""
         if self.is_combine:
@@ -291,17 +287,11 @@ class ActionAttack(Action):
 
         self.attacking_co = self.state.co[self.owner]
         self.defending_co = self.state.co[self.defending_unit.owner]
-        self.attacking_terrain = self.state.get_terrain(self.unit_position)
         self.defending_terrain = self.state.get_terrain(self.attack_target)
-        self.attacking_CT = 0
-        self.defending_CT = 0
-        for p in self.state.get_all_properties().values():
-            if p.owner == self.owner:
-                self.attacking_CT += 1
-            elif p.owner == self.defending_unit.owner:
-                self.defending_CT += 1
-
-        damage = calculate_damage(self.attacking_co, self.attacking_unit, self.defending_co, self.defending_unit, self.defending_terrain, self.attacking_CT)
+        self.attacking_CT = self.state.get_comm_tower_count(self.owner)
+        self.defending_CT = self.state.get_comm_tower_count(self.defending_unit.owner)
+
+        damage = calculate_damage(self.attacking_co, self.attacking_unit, self.defending_co, self.defending_unit, self.state.get_terrain_defense(self.attack_target), self.attacking_CT)
         
         self.attacking_unit.change_ammo(-self.attacker_ammo_used)
         original_health = self.defending_unit.get_display_health()
@@ -316,10 +306,14 @@ class ActionAttack(Action):
             self.state.remove_unit(self.attack_target)
             if self.defending_unit.can_capture and isinstance(self.defending_terrain, Property):
                 self.defending_terrain.change_capture(self.defending_terrain.owner, 20)
-            self.state.update_movement_cost()
+            # The defender's space is no longer blocked
+            self.state.refresh_movement_cost(self.attack_target)
 
         self.attacking_unit.available = False
 
+    def affected_positions(self):
+        return self.move_action.affected_positions() | {self.attack_target}
+
     def __str__(self) -> str:
         return f"{str(self.move_action)} then attack unit at {self.attack_target}"
 
@@ -345,7 +339,7 @@ class ActionDirectAttack(ActionAttack):
         super().execute()
 
         if self.can_counterattack:
-            counterattack = calculate_damage(self.defending_co, self.defending_unit, self.attacking_co, self.attacking_unit, self.attacking_terrain, self.defending_CT)
+            counterattack = calculate_damage(self.defending_co, self.defending_unit, self.attacking_co, self.attacking_unit, self.state.get_terrain_defense(self.unit_position), self.defending_CT)
             self.defending_unit.change_ammo(-self.defender_ammo_used)
             original_health = self.attacking_unit.get_display_health()
             self.attacking_unit.change_health(-counterattack)
@@ -359,7 +353,7 @@ class ActionDirectAttack(ActionAttack):
                 self.state.remove_unit(self.destination)
                 if self.attacking_unit.can_capture and isinstance(self.attacking_unit, Property):
                     self.attacking_unit.change_capture(self.attacking_unit.owner, 20)
-                self.state.update_movement_cost()
+                # Own units never block movement, so losing the attacker leaves reachability unchanged
 
 class ActionIndirectAttack(ActionAttack):
     def __init__(self, unit_position, attack_offset) -> None:
@@ -423,6 +417,9 @@ class ActionCapture(Action):
         self.property.change_capture(self.owner, -self.capturing_unit.get_display_health())
         self.capturing_unit.available = False
 
+    def affected_positions(self):
+        return self.move_action.affected_positions()
+
     def __str__(self) -> str:
         return f"{str(self.move_action)} then capture"
 
@@ -440,12 +437,12 @@ class ActionBuild(Action):
             self.invalid_message = f"No property owned by {self.owner} found at (r:{self.property_position[0]}, c:{self.property_position[1]})"
             return False
         
-        self.new_unit = state.unit_library.create(self.unit_code, self.owner)
-        if state.funds[self.owner] < self.new_unit.cost:
+        unit_class = state.unit_library.get_class(self.unit_code)
+        if state.funds[self.owner] < unit_class.cost:
             self.invalid_message = "Cannot afford to build"
             return False
 
-        if type(self.new_unit) not in property.buildables:
+        if unit_class not in property.buildables:
             self.invalid_message = f"{property} cannot build {self.unit_code}"
             return False
 
@@ -459,11 +456,16 @@ class ActionBuild(Action):
     def execute(self):
         super().execute()
 
+        # Only the unit class is checked in validate, the unit is created here
+        self.new_unit = self.state.unit_library.create(self.unit_code, self.owner)
         self.state.set_unit(self.new_unit, self.property_position)
         self.state.funds[self.owner] -= self.new_unit.cost
         self.state.unit_built[self.owner] = True
         self.new_unit.available = False
 
+    def affected_positions(self):
+        return {self.property_position}
+
     def __str__(self) -> str:
         return "Build {} at {}".format(self.unit_code, self.property_position)
 
@@ -521,6 +523,9 @@ class ActionRepair(Action):
         self.unit_to_repair.change_ammo(self.unit_to_repair.max_ammo)
         self.repairing_unit.available = False
 
+    def affected_positions(self):
+        return self.move_action.affected_positions() | {self.repair_target}
+
     def __str__(self) -> str:
         return f"{str(self.move_action)} then repairs unit at {self.repair_target}"
 
@@ -572,12 +577,11 @@ class ActionUnload(Action):
             self.invalid_message = f"{self.unload_position} is not a valid unload position"
             return False
 
-        if terrain.get_move_cost(self.unloaded_unit.move_type) == 0:
+        if state.get_move_cost(self.unload_position, self.unloaded_unit.move_type) == 0:
             self.invalid_message = f"{self.unloaded_unit} cannot be placed on {terrain}"
             return False
 
-        own_terrain = state.get_terrain(self.destination)
-        if own_terrain.get_move_cost(self.unloaded_unit.move_type) == 0:
+        if state.get_move_cost(self.destination, self.unloaded_unit.move_type) == 0:
             self.invalid_message = f"{self.unloading_unit} cannot unload while on {terrain}"
             return False
 
@@ -596,6 +600,9 @@ class ActionUnload(Action):
         self.state.set_unit(self.unloaded_unit, self.unload_position)
         self.unloading_unit.available = False
 
+    def affected_positions(self):
+        return self.move_action.affected_positions() | {self.unload_position}
+
     def __str__(self) -> str:
         return f"{str(self.move_action)} then unloads {self.idx} at {self.unload_position}"
 
@@ -617,6 +624,9 @@ class ActionCOP(Action):
 
         self.co.apply_cop(self.state)
 
+    def affected_positions(self):
+        return set(self.state.get_all_units(self.co.player))
+
 class ActionSCOP(Action):
     def __init__(self):
         super().__init__()
@@ -635,6 +645,9 @@ class ActionSCOP(Action):
 
         self.co.apply_scop(self.state)
 
+    def affected_positions(self):
+        return set(self.state.get_all_units(self.co.player))
+
 class ActionHide(Action):
     pass
         
@@ -45,6 +45,13 @@ class BaseCO:
     def get_defense_modifier(self, unit_type):
         return self.modifiers.get(unit_type, (0, 0))[1]
 
+    # Modifiers are replaced rather than mutated, so statuses can share the dict
+    def get_status(self):
+        return (self.power, self.powers_used, self.cop_applied, self.scop_applied, self.modifiers)
+
+    def set_status(self, status):
+        self.power, self.powers_used, self.cop_applied, self.scop_applied, self.modifiers = status
+
     def get_luck_roll(self):
         return random.randint(0, 9)
 
@@ -60,20 +67,14 @@ class BaseCO:
         return self.power / (self.scop_amount * math.pow(1.2, self.powers_used))
 
     def apply_cop(self, state):
-        for unit in self.modifiers:
-            original_modifier = self.modifiers[unit]
-            new_modifier = (original_modifier[0] + 10, original_modifier[1] + 10)
-            self.modifiers[unit] = new_modifier
+        self.modifiers = {unit: (modifier[0] + 10, modifier[1] + 10) for unit, modifier in self.modifiers.items()}
 
         self.cop_applied = True
         self.powers_used = min(10, self.powers_used + 1)
         self.power = 0
 
     def apply_scop(self, state):
-        for unit in self.modifiers:
-            original_modifier = self.modifiers[unit]
-            new_modifier = (original_modifier[0] + 10, original_modifier[1] + 10)
-            self.modifiers[unit] = new_modifier
+        self.modifiers = {unit: (modifier[0] + 10, modifier[1] + 10) for unit, modifier in self.modifiers.items()}
         
         self.scop_applied = True
         self.powers_used = min(10, self.powers_used + 1)
@@ -100,7 +101,7 @@ class COAdder(BaseCO):
             unit.move += 1
 
         # Update movement costs due to new move range
-        state.update_movement_cost()
+        state.refresh_movement_cost()
         
         super().apply_cop(state)
 
@@ -109,7 +110,7 @@ class COAdder(BaseCO):
             unit.move += 2
 
         # Update movement costs due to new move range
-        state.update_movement_cost()
+        state.refresh_movement_cost()
 
         super().apply_scop(state)
 
@@ -0,0 +1,149 @@
+from Game.Terrain import Property
+from Game.MoveType import MoveType
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+'''
+A map parsed into plain arrays: terrain codes, starting units and the per move type cost of entering each tile.
+Compiled maps are stored as a directory of .npy files that are memory-mapped read-only when loaded,
+so every process using the same map shares one copy of the arrays through the OS page cache.
+'''
+class CompiledMap:
+    def __init__(self, terrain_codes, unit_codes, unit_owners, unit_positions, move_costs):
+        self.terrain_codes = terrain_codes
+        self.unit_codes = unit_codes
+        self.unit_owners = unit_owners
+        self.unit_positions = unit_positions
+        # Stacked (MoveType, height, width) costs, exposed per move type as views
+        # Locked before taking the views, which keep the writeable flag their base had
+        move_costs.flags.writeable = False
+        self.move_costs_array = move_costs
+        self.move_costs = {move_type: move_costs[i] for i, move_type in enumerate(MoveType)}
+
+    @classmethod
+    def compile(cls, map_data, terrain_library):
+        terrain = [[terrain_library.create(tile) for tile in row] for row in map_data["terrain"]]
+        unit_list = [
+            (unit_data["code"], owner, unit_data["row"], unit_data["col"])
+            for owner, owner_units in map_data["units"].items()
+            for unit_data in owner_units
+        ]
+        move_costs = terrain_library.get_move_costs(terrain_library.get_terrain_ids(terrain))
+
+        return cls(
+            terrain_codes=np.array(map_data["terrain"], dtype=str),
+            unit_codes=np.array([unit[0] for unit in unit_list], dtype=str),
+            unit_owners=np.array([unit[1] for unit in unit_list], dtype=str),
+            unit_positions=np.array([(unit[2], unit[3]) for unit in unit_list], dtype=np.int16).reshape(-1, 2),
+            move_costs=np.stack([move_costs[move_type] for move_type in MoveType])
+        )
+
+    def save(self, path):
+        arrays = {
+            "terrain_codes": self.terrain_codes,
+            "unit_codes": self.unit_codes,
+            "unit_owners": self.unit_owners,
+            "unit_positions": self.unit_positions,
+            "move_costs": self.move_costs_array
+        }
+
+        # Write to a temporary directory first so concurrent workers never read a partial map
+        cache_dir = os.path.dirname(path)
+        temp_path = tempfile.mkdtemp(dir=cache_dir)
+        for name, array in arrays.items():
+            np.save(os.path.join(temp_path, f"{name}.npy"), array)
+        # mkdtemp only lets its owner in, the cache is shared by every user of the checkout
+        os.chmod(temp_path, 0o755)
+        try:
+            os.rename(temp_path, path)
+        except OSError:
+            # Another worker finished compiling the same map first
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path):
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r', allow_pickle=False)
+            for name in ["terrain_codes", "unit_codes", "unit_owners", "unit_positions", "move_costs"]
+        }
+        return cls(**arrays)
+
+    def create_terrain(self, terrain_library):
+        return [[terrain_library.create(code) for code in row] for row in self.terrain_codes.tolist()]
+
+    def create_units(self, unit_library, players):
+        # Use the player keys as owners so identity checks against them hold
+        player_keys = {player: player for player in players}
+        return {
+            (r, c): unit_library.create(code, player_keys.get(owner, owner))
+            for code, owner, (r, c) in zip(self.unit_codes.tolist(), self.unit_owners.tolist(), self.unit_positions.tolist())
+        }
+
+def terrain_library_hash(terrain_library):
+    terrain_hash = hashlib.sha1()
+    for terrain_class in terrain_library.available_terrain:
+        costs = sorted((move_type.name, cost) for move_type, cost in terrain_class.costs.items())
+        terrain_hash.update(f"{terrain_class.code}|{terrain_class.defense}|{costs}".encode())
+        if issubclass(terrain_class, Property):
+            buildables = sorted(unit_class.code for unit_class in terrain_class.buildables)
+            terrain_hash.update(f"|{terrain_class.income}|{buildables}".encode())
+    return terrain_hash.hexdigest()
+
+'''
+Keeps one compiled map per map file and terrain library for the whole process.
+Maps are compiled to disk on first use and memory-mapped from then on, so the read-only
+arrays are shared by every State in the process and by every other process loading the same map.
+'''
+class MapRegistry:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self._compiled_maps = {}
+
+    def get_cache_dir(self, map_path):
+        if self.cache_dir is not None:
+            return self.cache_dir
+        return os.path.join(os.path.dirname(os.path.abspath(map_path)), ".compiled")
+
+    def get(self, map_path, terrain_library):
+        cache_dir = self.get_cache_dir(map_path)
+        map_stat = os.stat(map_path)
+        library_hash = terrain_library_hash(terrain_library)
+        registry_key = (os.path.abspath(map_path), map_stat.st_mtime_ns, map_stat.st_size, library_hash, str(cache_dir))
+        if registry_key in self._compiled_maps:
+            return self._compiled_maps[registry_key]
+
+        with open(map_path, 'rb') as map_file:
+            map_bytes = map_file.read()
+
+        map_hash = hashlib.sha1(map_bytes + library_hash.encode()).hexdigest()
+        map_name = os.path.splitext(os.path.basename(map_path))[0]
+        cache_path = os.path.join(cache_dir, f"{map_name}_{map_hash[:16]}")
+
+        compiled_map = None
+        if not os.path.isdir(cache_path):
+            compiled_map = CompiledMap.compile(json.loads(map_bytes), terrain_library)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                compiled_map.save(cache_path)
+            except OSError as e:
+                print(f"Could not cache compiled map {map_path}: {e}")
+
+        if os.path.isdir(cache_path):
+            try:
+                compiled_map = CompiledMap.load(cache_path)
+            except OSError as e:
+                # e.g. a cache written by another user that this one cannot read
+                print(f"Could not load cached map {cache_path}: {e}")
+                compiled_map = None
+
+        if compiled_map is None:
+            compiled_map = CompiledMap.compile(json.loads(map_bytes), terrain_library)
+
+        self._compiled_maps[registry_key] = compiled_map
+        return compiled_map
+
+map_registry = MapRegistry()
@@ -1,15 +1,15 @@
-from util import load_map
 from Game.Unit import UnitLibrary, standard_units
 from Game.Terrain import TerrainLibrary, Property, standard_terrain
 from Game.State import State
+from Game.CompiledMap import map_registry
 import random
-import copy
 import numpy as np
 
 class Game:
     def __init__(self, players, init_state=None, allowed_terrain=standard_terrain, allowed_units=standard_units, seed=0, save_history=True, strict=True):
         self.state = init_state
         self.history = []
+        self.history_index = 0
         self.seed = seed
         self.players = players
         self.allowed_terrain = allowed_terrain
@@ -26,8 +26,10 @@ class Game:
         terrain_library = TerrainLibrary(players, allowed_terrain)
         unit_library = UnitLibrary(allowed_units)
 
-        terrain, units = load_map(map_path, terrain_library, unit_library)
-        state = State(players_co, terrain, units)
+        compiled_map = map_registry.get(map_path, terrain_library)
+        terrain = compiled_map.create_terrain(terrain_library)
+        units = compiled_map.create_units(unit_library, players)
+        state = State(players_co, terrain, units, move_costs=compiled_map.move_costs, terrain_library=terrain_library)
         game = cls(players=players, init_state=state, seed=seed, save_history=save_history, strict=strict)
 
         return game
@@ -48,20 +50,48 @@ class Game:
                     print(f"INVALID ACTION {action}: {action.invalid_message}")
                     return self.state.check_winner()
 
+        affected_positions = action.affected_positions()
+        partial_hash = self.state.get_partial_hash(affected_positions)
+        change_marker = self.state.get_change_marker(affected_positions)
+        if self.save_history:
+            before = self.state.snapshot(affected_positions)
+
         action.execute()
 
+        self.state.zobrist_hash ^= partial_hash ^ self.state.get_partial_hash(affected_positions)
+        self.state.record_changes(affected_positions, change_marker)
         if self.save_history:
-            self.record_action(action)
+            self.record_action(action, before, self.state.snapshot(affected_positions))
 
         return self.state.check_winner()
 
-    def record_action(self, action):
-        self.history.append(
-            (
-                copy.deepcopy(action),
-                copy.deepcopy(self.state)
-            )
-        )
+    # History holds (action, before, after) deltas covering only the positions each action touched
+    def record_action(self, action, before, after):
+        del self.history[self.history_index:]
+        self.history.append((action, before, after))
+        self.history_index += 1
+
+    def undo(self):
+        if self.history_index == 0:
+            return False
+
+        self.history_index -= 1
+        _, before, _ = self.history[self.history_index]
+        self.state.restore(before)
+        return True
+
+    def redo(self):
+        if self.history_index == len(self.history):
+            return False
+
+        _, _, after = self.history[self.history_index]
+        self.state.restore(after)
+        self.history_index += 1
+        return True
+
+    def clear_history(self):
+        self.history = []
+        self.history_index = 0
 
     def __str__(self):
         output = ""
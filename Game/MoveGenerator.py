@@ -0,0 +1,233 @@
+from Game.Action import ActionEnd, ActionMove, ActionMoveCombineLoad, ActionDirectAttack, ActionIndirectAttack, ActionCapture, ActionBuild, ActionRepair, ActionUnload, ActionCOP, ActionSCOP
+from collections import namedtuple
+import functools
+import itertools
+
+directions = [(-1, 0), (1, 0), (0, 1), (0, -1)]
+
+'''
+A legal action of the current player, kept as plain data until create_action builds the Action.
+position is the acting unit or the building property, destination is where the unit moves to, target is the
+space attacked, repaired or unloaded to, and extra is the cargo index for unloads or the unit class for builds.
+Fields an action does not use are None.
+'''
+LegalAction = namedtuple("LegalAction", ["action_type", "position", "destination", "target", "extra"])
+
+# Offsets of the spaces at exactly this Manhattan distance
+@functools.lru_cache(maxsize=None)
+def ring_offsets(distance):
+    offsets = []
+    for offset_r in range(-distance, distance + 1):
+        offset_c = distance - abs(offset_r)
+        offsets.append((offset_r, offset_c))
+        if offset_c != 0:
+            offsets.append((offset_r, -offset_c))
+    return tuple(offsets)
+
+'''
+Enemy units of the current player by position, with the targets each kind of attacker can hit.
+Targets only depend on the attacker's type and ammo, so they are worked out once per pair and shared by every such unit.
+Direct attackers look up the spaces next to their targets, indirect attackers check the rings of their range
+or the targets themselves, whichever is fewer.
+'''
+class EnemyIndex:
+    def __init__(self, enemy_units):
+        self.enemy_units = enemy_units
+        self._targets = {}
+        self._attack_spots = {}
+
+    # Positions of the enemies the unit could attack from anywhere
+    def get_targets(self, unit):
+        key = (type(unit), unit.ammo)
+        targets = self._targets.get(key)
+        if targets is None:
+            attack_table = unit.attack_table
+            targets = set()
+            for position, enemy_unit in self.enemy_units.items():
+                attack = attack_table.get(type(enemy_unit))
+                if attack is not None and unit.ammo >= attack[1]:
+                    targets.add(position)
+            self._targets[key] = targets
+        return targets
+
+    # Spaces next to a target, with the targets each one can attack
+    def get_attack_spots(self, unit):
+        key = (type(unit), unit.ammo)
+        attack_spots = self._attack_spots.get(key)
+        if attack_spots is None:
+            attack_spots = {}
+            for target in self.get_targets(unit):
+                for offset_r, offset_c in directions:
+                    attack_spots.setdefault((target[0] - offset_r, target[1] - offset_c), []).append(target)
+            self._attack_spots[key] = attack_spots
+        return attack_spots
+
+    # Targets the unit could attack from position without moving
+    def get_targets_in_range(self, position, unit):
+        targets = self.get_targets(unit)
+        r, c = position
+        if len(targets) <= sum(4 * distance for distance in unit.range):
+            return [target for target in targets if abs(target[0] - r) + abs(target[1] - c) in unit.range]
+
+        in_range = []
+        for distance in unit.range:
+            for offset_r, offset_c in ring_offsets(distance):
+                target = (r + offset_r, c + offset_c)
+                if target in targets:
+                    in_range.append(target)
+        return in_range
+
+'''
+Streams the legal actions of the current player of a state.
+The checks follow the validate methods of each action without creating the actions, and every action
+yielded would pass validate. Being a generator, callers that stop early skip the remaining work.
+positions only keeps actions of units or properties at those positions, which leaves out End, COP and SCOP.
+action_types only keeps actions of those types, limit stops after that many actions.
+'''
+def legal_actions(state, positions=None, action_types=None, limit=None):
+    actions = _generate_legal_actions(state, positions, action_types)
+    if limit is not None:
+        actions = itertools.islice(actions, limit)
+    return actions
+
+def has_legal_action(state, positions=None, action_types=None):
+    return next(legal_actions(state, positions, action_types), None) is not None
+
+def create_action(legal_action):
+    action_type, position, destination, target, extra = legal_action
+
+    if action_type in (ActionEnd, ActionCOP, ActionSCOP):
+        return action_type()
+    if action_type is ActionBuild:
+        return ActionBuild(position, extra.code)
+    if action_type is ActionIndirectAttack:
+        return ActionIndirectAttack(position, (target[0] - position[0], target[1] - position[1]))
+
+    move_action = ActionMove(unit_position=position, offset=(destination[0] - position[0], destination[1] - position[1]))
+    if action_type is ActionMoveCombineLoad:
+        return ActionMoveCombineLoad(move_action=move_action)
+    if action_type is ActionCapture:
+        return ActionCapture(move_action=move_action)
+
+    offset = (target[0] - destination[0], target[1] - destination[1])
+    if action_type is ActionDirectAttack:
+        return ActionDirectAttack(move_action=move_action, attack_offset=offset)
+    if action_type is ActionRepair:
+        return ActionRepair(move_action=move_action, repair_offset=offset)
+    if action_type is ActionUnload:
+        return ActionUnload(move_action=move_action, unload_offset=offset, idx=extra)
+
+    raise Exception(f"Unknown action type {action_type}")
+
+def _generate_legal_actions(state, positions, action_types):
+    def wants(action_type):
+        return action_types is None or action_type in action_types
+
+    all_units = state.get_all_units()
+    current_player = state.get_current_player()
+    funds = state.funds[current_player]
+    height = state.map_height
+    width = state.map_width
+
+    if positions is None:
+        if wants(ActionEnd):
+            yield LegalAction(ActionEnd, None, None, None, None)
+
+        # COs without powers have no power meter to divide by
+        co = state.get_co(current_player)
+        if wants(ActionCOP) and co.cop_amount > 0 and co.cop_progress() >= 1:
+            yield LegalAction(ActionCOP, None, None, None, None)
+        if wants(ActionSCOP) and co.scop_amount > 0 and co.scop_progress() >= 1:
+            yield LegalAction(ActionSCOP, None, None, None, None)
+
+    want_move = wants(ActionMoveCombineLoad)
+    want_direct_attack = wants(ActionDirectAttack)
+    want_indirect_attack = wants(ActionIndirectAttack)
+    want_capture = wants(ActionCapture)
+    want_repair = wants(ActionRepair)
+    want_unload = wants(ActionUnload)
+
+    if want_move or want_direct_attack or want_indirect_attack or want_capture or want_repair or want_unload:
+        enemy_index = EnemyIndex({position: unit for position, unit in all_units.items() if unit.owner != current_player})
+        properties = state.get_all_properties()
+        own_units = state.get_all_units(owner=current_player)
+        unit_positions = own_units if positions is None else [position for position in positions if position in own_units]
+
+        for position in unit_positions:
+            unit = own_units[position]
+            if not unit.available:
+                continue
+
+            #Indirect Attack, the unit has to be able to stay on its own space
+            if want_indirect_attack and 1 not in unit.range and position in state.get_reachable_spaces(position, unit):
+                for target in enemy_index.get_targets_in_range(position, unit):
+                    yield LegalAction(ActionIndirectAttack, position, position, target, None)
+
+            attack_spots = enemy_index.get_attack_spots(unit) if want_direct_attack and 1 in unit.range else None
+
+            for destination, fuel_cost in state.get_reachable_spaces(position, unit).items():
+                if fuel_cost > unit.fuel:
+                    continue
+
+                destination_r, destination_c = destination
+
+                #Move/Combine/Load, staying in place counts as combining with itself
+                unit_at_destination = all_units.get(destination)
+                if want_move:
+                    if unit_at_destination is None:
+                        yield LegalAction(ActionMoveCombineLoad, position, destination, None, None)
+                    elif unit_at_destination is not unit and unit_at_destination.owner == current_player:
+                        if type(unit) == type(unit_at_destination):
+                            if unit_at_destination.get_display_health() != 10:
+                                yield LegalAction(ActionMoveCombineLoad, position, destination, None, None)
+                        elif unit_at_destination.can_load(unit):
+                            yield LegalAction(ActionMoveCombineLoad, position, destination, None, None)
+
+                # Every other action needs the destination free
+                if unit_at_destination is not None and unit_at_destination is not unit:
+                    continue
+
+                #Direct Attack
+                if attack_spots is not None and destination in attack_spots:
+                    for target in attack_spots[destination]:
+                        yield LegalAction(ActionDirectAttack, position, destination, target, None)
+
+                #Capture
+                if want_capture and unit.can_capture:
+                    property = properties.get(destination)
+                    if property is not None and property.owner is not current_player:
+                        yield LegalAction(ActionCapture, position, destination, None, None)
+
+                #Repair
+                if want_repair and unit.can_repair:
+                    for offset_r, offset_c in directions:
+                        target = (destination_r + offset_r, destination_c + offset_c)
+                        unit_to_repair = all_units.get(target)
+                        if unit_to_repair is None or unit_to_repair.owner != current_player:
+                            continue
+                        repair_amount = min(unit.repair_amount, 10 - unit_to_repair.get_display_health())
+                        if funds >= (repair_amount / 10) * unit_to_repair.cost:
+                            yield LegalAction(ActionRepair, position, destination, target, None)
+
+                #Unload
+                if want_unload:
+                    for idx, unloaded_unit in enumerate(unit.in_load):
+                        if state.get_move_cost(destination, unloaded_unit.move_type) == 0:
+                            continue
+                        for offset_r, offset_c in directions:
+                            target = (destination_r + offset_r, destination_c + offset_c)
+                            if target[0] < 0 or target[0] >= height or target[1] < 0 or target[1] >= width:
+                                continue
+                            if target in all_units or state.get_move_cost(target, unloaded_unit.move_type) == 0:
+                                continue
+                            yield LegalAction(ActionUnload, position, destination, target, idx)
+
+    #Build
+    if wants(ActionBuild):
+        own_properties = state.get_all_properties(owner=current_player)
+        property_positions = own_properties if positions is None else [position for position in positions if position in own_properties]
+        for position in property_positions:
+            if position in all_units:
+                continue
+            for unit_type in own_properties[position].get_affordable_buildables(funds):
+                yield LegalAction(ActionBuild, position, None, None, unit_type)
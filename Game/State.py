@@ -1,15 +1,22 @@
-from Game.Terrain import Property, TerrainHeadquarters, TerrainLab
+from Game.Terrain import Property, TerrainHeadquarters, TerrainLab, TerrainCommTower, TerrainLibrary, standard_terrain
 from Game.Unit import UnitLibrary, standard_units
-from Game.MoveType import MoveType
+from Game.Zobrist import get_zobrist_table
+from Game.UnitStore import UnitStore
+from Game.StateChanges import StateChanges, SCALARS
+from Game.MoveGenerator import legal_actions as generate_legal_actions
 import math
+import copy
+import functools
+import heapq
+from types import MappingProxyType
 import numpy as np
-import queue
-from scipy.sparse.csgraph import shortest_path
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
 '''
 A data class
 '''
 class State:
-    def __init__(self, co=None, terrain=[[]], units={}, funds=None, first_player=0):
+    def __init__(self, co=None, terrain=[[]], units={}, funds=None, first_player=0, move_costs=None, terrain_library=None):
         self.co = co
         for player, co in self.co.items():
             co.set_player(player)
@@ -20,81 +27,164 @@ class State:
         self.map_height = len(terrain)
         self.map_width = len(terrain[0])
 
-        self.units = units
-
         self.players = list(self.co.keys())
 
+        self.terrain_library = terrain_library or TerrainLibrary(self.players, standard_terrain)
+        self.terrain_ids = self.terrain_library.get_terrain_ids(self.terrain)
+        self.terrain_defense = self.terrain_library.get_defense(self.terrain_ids)
+
+        self.unit_store = UnitStore(self.map_height, self.map_width, self.players, self.unit_library.available_unit)
+        self.units = units
+
         self.current_player = first_player
         
         self.current_day = 1
 
         self.properties = {(r, c): self.terrain[r][c] for r in range(self.map_height) for c in range(self.map_width) if isinstance(self.terrain[r][c], Property)}
+        self._index_properties()
 
         self.funds = funds or {player: 1000 * len(self.get_all_properties(player)) if player == self.get_current_player() else 0 for player in self.players}
 
         self.unit_built = {player: len(self.get_all_units(owner=player)) > 0 for player in self.players}
-        self.has_hq = {player: any([isinstance(property, TerrainHeadquarters) for property in self.get_all_properties(owner=player).values()]) for player in self.players}
-        self.has_lab = {player: any([isinstance(property, TerrainLab) for property in self.get_all_properties(owner=player).values()]) for player in self.players}
+        self.has_hq = {player: self._hq_count.get(player, 0) > 0 for player in self.players}
+        self.has_lab = {player: self._lab_count.get(player, 0) > 0 for player in self.players}
 
-        self._movement_costs = {}
+        # Read-only, may be shared with other states through the map registry
+        self._move_costs = move_costs or self.terrain_library.get_move_costs(self.terrain_ids)
+        self._flat_move_costs = {}
+        self._movement_graph = {}
+        self._path_trees = {}
 
-        self._terrain_adjacency_matrix = {
-            move_type: np.full((self.map_height * self.map_width, self.map_height * self.map_width), 100) for move_type in MoveType
-        }
-        self._terrain_movement_costs = {}
-
-        for move_type in MoveType:
-            for r in range(self.map_height):
-                for c in range(self.map_width):
-                    source_idx = r * self.map_width + c
-                    self._terrain_adjacency_matrix[move_type][source_idx][source_idx] = 0
-
-                    targets = [
-                        (r + 1, c),
-                        (r - 1, c),
-                        (r, c + 1),
-                        (r, c - 1)
-                    ]
-
-                    for target in targets:
-                        target_idx = target[0] * self.map_width + target[1]
-                        
-                        terrain = self.get_terrain(target)
-                        if terrain is None:
-                            continue
-
-                        cost = terrain.get_move_cost(move_type)
-                        if cost == 0:
-                            continue
-
-                        self._terrain_adjacency_matrix[move_type][source_idx][target_idx] = cost
-            self._terrain_movement_costs[move_type] = shortest_path(self._terrain_adjacency_matrix[move_type]).astype(int)
-        
         self.update_movement_cost()
 
+        self._zobrist = get_zobrist_table(self.map_height, self.map_width, self.players, self.unit_library.available_unit)
+        self.zobrist_hash = self.compute_hash()
+
+        self.changes = StateChanges(full=True)
+
+    '''
+    Cloned states get their own board (units, properties and the terrain grid holding them), the source keeps its objects
+    so references held by history, snapshots or callers stay valid.
+    Terrain tiles, unit class stats and the map precomputation are shared and never copied.
+    '''
+    def clone(self):
+        new_state = State.__new__(State)
+        new_state.__dict__.update(self.__dict__)
+
+        new_state.co = {player: copy.copy(co) for player, co in self.co.items()}
+        new_state.funds = dict(self.funds)
+        new_state.unit_built = dict(self.unit_built)
+        new_state.has_hq = dict(self.has_hq)
+        new_state.has_lab = dict(self.has_lab)
+        new_state.changes = StateChanges(full=True)
+        new_state._path_trees = {}
+        new_state._unblocked_spaces = dict(self._unblocked_spaces)
+        new_state._copy_board()
+        return new_state
+
+    def _copy_board(self):
+        def copy_unit(unit):
+            new_unit = copy.copy(unit)
+            new_unit.in_load = [copy_unit(cargo) for cargo in unit.in_load]
+            return new_unit
+        self._units = {position: copy_unit(unit) for position, unit in self._units.items()}
+        self._index_units()
+
+        unit_store = self.unit_store.copy()
+        for unit in self._units.values():
+            unit_store.rebind(unit._slot, unit)
+        self.unit_store = unit_store
+
+        self.properties = {position: copy.copy(property) for position, property in self.properties.items()}
+        self._index_properties()
+        terrain = [list(row) for row in self.terrain]
+        for (r, c), property in self.properties.items():
+            terrain[r][c] = property
+        self.terrain = terrain
+
+    @property
+    def units(self):
+        return self._units
+
+    @units.setter
+    def units(self, units):
+        self._units = units
+        self._index_units()
+        self.unit_store.clear()
+        for position, unit in units.items():
+            self.unit_store.place(unit, position)
+
+    # Per owner indices of the board, kept up to date by set_unit, remove_unit and property owner changes
+    def _index_units(self):
+        self._units_by_owner = {player: {} for player in self.players}
+        for position, unit in self._units.items():
+            self._units_by_owner.setdefault(unit.owner, {})[position] = unit
+
+    def _index_properties(self):
+        self._properties_by_owner = {}
+        # Per player property counters: HQs and labs for check_winner, comm towers and income for actions
+        self._hq_count = {}
+        self._lab_count = {}
+        self._comm_tower_count = {}
+        self._income = {}
+        for position, property in self.properties.items():
+            property.owner_listener = functools.partial(self._on_property_owner_change, position)
+            self._properties_by_owner.setdefault(property.owner, {})[position] = property
+            self._count_property(property, property.owner, 1)
+
+    def _on_property_owner_change(self, position, property, previous_owner):
+        del self._properties_by_owner[previous_owner][position]
+        self._properties_by_owner.setdefault(property.owner, {})[position] = property
+        self._count_property(property, previous_owner, -1)
+        self._count_property(property, property.owner, 1)
+
+    def _count_property(self, property, owner, amount):
+        self._income[owner] = self._income.get(owner, 0) + amount * property.income
+        if isinstance(property, TerrainHeadquarters):
+            self._hq_count[owner] = self._hq_count.get(owner, 0) + amount
+        elif isinstance(property, TerrainLab):
+            self._lab_count[owner] = self._lab_count.get(owner, 0) + amount
+        elif isinstance(property, TerrainCommTower):
+            self._comm_tower_count[owner] = self._comm_tower_count.get(owner, 0) + amount
+
+    def get_income(self, player):
+        return self._income.get(player, 0)
+
+    def get_comm_tower_count(self, player):
+        return self._comm_tower_count.get(player, 0)
+
     def get_unit(self, unit_position, owner=None):
         if unit_position in self.units:
             unit = self.units[unit_position]
-            return unit if owner is None or unit.owner is owner else None
+            return unit if owner is None or unit.owner == owner else None
         return None
 
+    # Owner filtered results are read-only views of the per owner index
     def get_all_units(self, owner=None):
+        units = self.units
         if owner is None:
-            return self.units
+            return units
         else:
-            return {position: unit for position, unit in self.units.items() if unit.owner is owner}
+            return MappingProxyType(self._units_by_owner.get(owner, {}))
 
     def remove_unit(self, unit_position):
         if unit_position not in self.units:
             return
 
-        del self.units[unit_position]
+        unit = self.units.pop(unit_position)
+        del self._units_by_owner[unit.owner][unit_position]
+        self.unit_store.remove(unit_position)
     
     def set_unit(self, unit, position):
+        previous_unit = self.units.get(position)
+        if previous_unit is not None and previous_unit.owner != unit.owner:
+            del self._units_by_owner[previous_unit.owner][position]
         self.units[position] = unit
+        self._units_by_owner.setdefault(unit.owner, {})[position] = unit
+        self.unit_store.place(unit, position)
     
     def add_unit(self, position, unit_code, owner):
-        self.units[position] = self.unit_library.create(unit_code, owner)
+        self.set_unit(self.unit_library.create(unit_code, owner), position)
 
     def get_current_player(self):
         return self.players[self.current_player]
@@ -105,18 +195,22 @@ class State:
     
         return self.terrain[position[0]][position[1]]
 
+    def get_terrain_defense(self, position):
+        return int(self.terrain_defense[position[0], position[1]])
+
     def get_property(self, position, owner=None):
         if position in self.properties:
             property = self.properties[position]
-            return property if owner is None or property.owner is owner else None
+            return property if owner is None or property.owner == owner else None
         else:
             return None
     
     def get_all_properties(self, owner=None):
+        properties = self.properties
         if owner is None:
-            return self.properties
+            return properties
         else:
-            return {position: property for position, property in self.properties.items() if property.owner is owner}
+            return MappingProxyType(self._properties_by_owner.get(owner, {}))
 
     def set_terrain(self, terrain, position):
         self.terrain[position[0]][position[1]] = terrain
@@ -124,16 +218,17 @@ class State:
     def get_co(self, player):
         return self.co.get(player)
 
+    # Reads the board counters directly, so checking a cloned state does not force a copy of its board
     def check_winner(self):
         remaining_players = set(self.players)
         for player in self.players:
-            if self.has_hq[player] and not any([isinstance(property, TerrainHeadquarters) for property in self.get_all_properties(owner=player).values()]):
+            if self.has_hq[player] and self._hq_count.get(player, 0) == 0:
                 remaining_players.discard(player)
                 continue
-            if self.has_lab[player] and not any([isinstance(property, TerrainLab) for property in self.get_all_properties(owner=player).values()]):
+            if self.has_lab[player] and self._lab_count.get(player, 0) == 0:
                 remaining_players.discard(player)
                 continue
-            if self.unit_built[player] and len(self.get_all_units(owner=player)) == 0:
+            if self.unit_built[player] and len(self._units_by_owner.get(player, ())) == 0:
                 remaining_players.discard(player)
                 continue
         
@@ -145,11 +240,11 @@ class State:
             return stats
             
         stats = {}
-        player_units = self.get_all_units(player)
+        player_index = self.players.index(player)
         # Unit count
-        stats['unit_count'] = len(player_units)
+        stats['unit_count'] = int(self.unit_store.get_unit_counts()[player_index])
         # Army value
-        stats['army_value'] = sum([unit.cost * unit.get_display_health() / 10 for unit in player_units.values()])
+        stats['army_value'] = float(self.unit_store.get_army_values()[player_index])
         # Income
         stats['income'] = len(self.get_all_properties(player)) * 1000
         # Funds
@@ -158,6 +253,123 @@ class State:
         
         return stats
     
+    # Hash of the units and properties at the given positions combined with the player and CO power flags.
+    # XORing this over an action's footprint before and after it executes keeps zobrist_hash up to date.
+    def get_partial_hash(self, positions):
+        partial_hash = self._zobrist.hash_players(self.current_player, self.co)
+        for position in positions:
+            unit = self.units.get(position)
+            if unit is not None:
+                partial_hash ^= self._zobrist.hash_unit(position, unit)
+            property = self.properties.get(position)
+            if property is not None:
+                partial_hash ^= self._zobrist.hash_property(position, property)
+        return partial_hash
+
+    def compute_hash(self):
+        return self.get_partial_hash(set(self.units) | set(self.properties))
+
+    # Taken before a change to the given positions, passed to record_changes once it is done
+    def get_change_marker(self, positions):
+        units = self.units
+        return ({position for position in positions if position in units}, self._get_scalar_status())
+
+    def record_changes(self, positions, marker):
+        units_before, scalars_before = marker
+        units = self.units
+        properties = self.properties
+
+        changes = self.changes
+        changes.cells.update(positions)
+        changes.units.update(units_before)
+        changes.units.update(position for position in positions if position in units)
+        changes.properties.update(position for position in positions if position in properties)
+        for name, before, after in zip(SCALARS, scalars_before, self._get_scalar_status()):
+            if before != after:
+                changes.scalars.add(name)
+
+    # Hands the accumulated changes to the caller and starts a new record
+    def drain_changes(self):
+        changes = self.changes
+        self.changes = StateChanges()
+        return changes
+
+    def _get_scalar_status(self):
+        return (
+            tuple(self.funds.values()),
+            tuple((co.power, co.cop_applied, co.scop_applied) for co in self.co.values()),
+            self.current_day,
+            self.current_player
+        )
+
+    # Captures the mutable game data so the state can be restored in place later.
+    # Units and properties keep their identity across a restore, only their fields are reset.
+    # When positions are given, only the units and properties at those positions are captured.
+    def snapshot(self, positions=None):
+        if positions is None:
+            units = dict(self.units)
+            properties = self.properties
+        else:
+            units = {position: self.units.get(position) for position in positions}
+            properties = {position: self.properties[position] for position in positions if position in self.properties}
+
+        unit_status = {}
+        pending = [unit for unit in units.values() if unit is not None]
+        while len(pending) > 0:
+            unit = pending.pop()
+            unit_status[unit] = unit.get_status()
+            pending.extend(unit.in_load)
+
+        return {
+            "partial": positions is not None,
+            "units": units,
+            "unit_status": unit_status,
+            "property_status": {position: (property.owner, property.capture_amount) for position, property in properties.items()},
+            "co_status": {player: co.get_status() for player, co in self.co.items()},
+            "funds": dict(self.funds),
+            "unit_built": dict(self.unit_built),
+            "current_player": self.current_player,
+            "current_day": self.current_day,
+            "zobrist_hash": self.zobrist_hash,
+            "unblocked_spaces": dict(self._unblocked_spaces)
+        }
+
+    def restore(self, snapshot):
+        if snapshot["partial"]:
+            positions = set(snapshot["units"]) | set(snapshot["property_status"])
+            change_marker = self.get_change_marker(positions)
+            for position, unit in snapshot["units"].items():
+                if unit is None:
+                    self.remove_unit(position)
+                else:
+                    self.set_unit(unit, position)
+        else:
+            self.units = dict(snapshot["units"])
+            self.changes.full = True
+
+        for unit, status in snapshot["unit_status"].items():
+            unit.set_status(status)
+
+        for position, (owner, capture_amount) in snapshot["property_status"].items():
+            property = self.properties[position]
+            property.owner = owner
+            property.capture_amount = capture_amount
+
+        for player, status in snapshot["co_status"].items():
+            self.co[player].set_status(status)
+
+        self.funds = dict(snapshot["funds"])
+        self.unit_built = dict(snapshot["unit_built"])
+        self.current_player = snapshot["current_player"]
+        self.current_day = snapshot["current_day"]
+        self.zobrist_hash = snapshot["zobrist_hash"]
+        self._unblocked_spaces = dict(snapshot["unblocked_spaces"])
+        self._occupied_spaces = None
+        self._path_trees = {}
+
+        if snapshot["partial"]:
+            self.record_changes(positions, change_marker)
+
     def text_display(self):
         unit_grid  = [[None for _ in range(self.map_width)] for _ in range(self.map_height)]
 
@@ -193,82 +405,172 @@ class State:
             
         return "\n".join(map_lines)
 
-    # def update_movement_cost(self):
-    #     current_player = self.get_current_player()
-    #     available_move_types = set()
-            
-    #     occupancy_grid = np.full((self.map_height * self.map_width, self.map_height * self.map_width), 0)
-    #     for position, unit in self.get_all_units().items():
-    #         if unit.owner != current_player:
-    #             occupancy_grid[:,position[0] * self.map_width + position[1]] = 100
-    #         else:
-    #             available_move_types.add(unit.move_type)
+    # Streams the current player's legal actions, see Game.MoveGenerator
+    def legal_actions(self, positions=None, action_types=None, limit=None):
+        return generate_legal_actions(self, positions, action_types, limit)
 
-    #     for move_type in available_move_types:
-    #         graph = occupancy_grid + self._terrain_movement_costs[move_type]
-    #         self._movement_costs[move_type] = shortest_path(graph)
+    def get_occupied_spaces(self):
+        current_player = self.get_current_player()
+        return {position[0] * self.map_width + position[1] for position, unit in self.get_all_units().items() if unit.owner != current_player}
 
-    
+    # Reachability is computed on demand by get_reachable_spaces and memoized until invalidated here
     def update_movement_cost(self):
-        current_player = self.get_current_player()
-        occupied = {position for position, unit in self.get_all_units().items() if unit.owner != current_player}
-            
+        self._occupied_spaces = None
         self._unblocked_spaces = {}
-        for position, unit in self.get_all_units(owner=current_player).items():
-            self._unblocked_spaces[position] = self.get_unblocked_spaces(position, unit, occupied)
-        
-    
-    def get_unblocked_spaces(self, start, unit, occupied):
-        visited = set()
-        pending = [start]
+        self._path_trees = {}
+
+    # Invalidates reachability only for units within move range of changed_position, since every step costs at least 1.
+    # Without changed_position, move ranges changed and every unit is invalidated.
+    def refresh_movement_cost(self, changed_position=None):
+        self._occupied_spaces = None
+        if changed_position is None:
+            self._unblocked_spaces = {}
+            self._path_trees = {}
+            return
+
+        def out_of_range(position, move):
+            return abs(position[0] - changed_position[0]) + abs(position[1] - changed_position[1]) > move
+
+        units = self.units
+        self._unblocked_spaces = {position: spaces for position, spaces in self._unblocked_spaces.items() if position in units and out_of_range(position, units[position].move)}
+        # Path trees are keyed by (start, move type, move)
+        self._path_trees = {key: tree for key, tree in self._path_trees.items() if out_of_range(key[0], key[2])}
+
+    # Cheapest movement cost to every space the unit at position can reach this turn, see get_unblocked_spaces
+    def get_reachable_spaces(self, position, unit=None):
+        spaces = self._unblocked_spaces.get(position)
+        if spaces is None:
+            if unit is None:
+                unit = self.units.get(position)
+            if unit is None:
+                return {}
+            spaces = self.get_unblocked_spaces(position, unit, self._get_occupied_spaces())
+            self._unblocked_spaces[position] = spaces
+        return spaces
+
+    def _get_occupied_spaces(self):
+        if self._occupied_spaces is None:
+            self._occupied_spaces = self.get_occupied_spaces()
+        return self._occupied_spaces
+
+    # Bounded Dijkstra from start, returns the cheapest movement cost to every space the unit can reach this turn.
+    # Only the move range bounds the search; fuel is still checked by ActionMove so resupplies do not stale the result.
+    # When predecessors is given, it is filled with the previous space on the cheapest route to each space, -1 for start.
+    def get_unblocked_spaces(self, start, unit, occupied, predecessors=None):
+        width = self.map_width
+        height = self.map_height
+        costs = self.get_flat_move_costs(unit.move_type)
+        budget = unit.move
+
+        start_id = start[0] * width + start[1]
+        if costs[start_id] == 0 or start_id in occupied:
+            return {}
+
+        if predecessors is not None:
+            predecessors[start_id] = -1
+        best = {start_id: 0}
+        pending = [(0, start_id)]
         while len(pending) > 0:
-            current = pending.pop()
-            terrain = self.terrain[current[0]][current[1]]
-            
-            if current in visited or current in occupied or terrain.get_move_cost(unit.move_type) == 0:
+            distance, current = heapq.heappop(pending)
+            if distance > best[current]:
                 continue
-            visited.add(current)
 
-            distance = abs(current[0] - start[0]) + abs(current[1] - start[1])
-            if distance + 1 > unit.move:
-                continue
-            above = current[0] + 1
-            if above < self.map_height:
-                pending.append((above, current[1]))
-            below = current[0] - 1
-            if below >= 0:
-                pending.append((below, current[1]))
-            right = current[1] + 1
-            if right < self.map_width:
-                pending.append((current[0], right))
-            left = current[1] - 1
-            if left >= 0:
-                pending.append((current[0], current[1]-1))
-
-        return visited
+            r, c = divmod(current, width)
+            neighbours = []
+            if r + 1 < height:
+                neighbours.append(current + width)
+            if r > 0:
+                neighbours.append(current - width)
+            if c + 1 < width:
+                neighbours.append(current + 1)
+            if c > 0:
+                neighbours.append(current - 1)
+
+            for neighbour in neighbours:
+                cost = costs[neighbour]
+                if cost == 0 or neighbour in occupied:
+                    continue
+                new_distance = distance + cost
+                if new_distance > budget or new_distance >= best.get(neighbour, budget + 1):
+                    continue
+                best[neighbour] = new_distance
+                if predecessors is not None:
+                    predecessors[neighbour] = current
+                heapq.heappush(pending, (new_distance, neighbour))
+
+        return {divmod(space, width): distance for space, distance in best.items()}
+
+    # Row-major list of the cost of entering each tile, 0 if the tile cannot be entered
+    def get_flat_move_costs(self, move_type):
+        costs = self._flat_move_costs.get(move_type)
+        if costs is None:
+            costs = self._move_costs[move_type].ravel().tolist()
+            self._flat_move_costs[move_type] = costs
+        return costs
+
+    def get_move_cost(self, position, move_type):
+        return self.get_flat_move_costs(move_type)[position[0] * self.map_width + position[1]]
 
     def get_movement_cost(self, start, end, unit):
-        start_id = start[0] * self.map_width + start[1]
-        end_id = end[0] * self.map_width + end[1]
+        return self.get_reachable_spaces(start, unit).get(end, 100)
 
-        if end in self._unblocked_spaces[start]:
-            return self._terrain_movement_costs[unit.move_type][start_id][end_id]
-        else:
-            return 100
+    # 4-neighbour graph where each edge costs the terrain cost of the space being entered
+    def get_movement_graph(self, move_type):
+        if move_type in self._movement_graph:
+            return self._movement_graph[move_type]
+
+        height = self.map_height
+        width = self.map_width
+        costs = self._move_costs[move_type].ravel()
+        ids = np.arange(height * width, dtype=np.int32).reshape(height, width)
+
+        sources = np.concatenate([ids[1:, :].ravel(), ids[:-1, :].ravel(), ids[:, 1:].ravel(), ids[:, :-1].ravel()])
+        targets = np.concatenate([ids[:-1, :].ravel(), ids[1:, :].ravel(), ids[:, :-1].ravel(), ids[:, 1:].ravel()])
+        passable = costs[targets] > 0
+
+        graph = csr_matrix((costs[targets[passable]], (sources[passable], targets[passable])), shape=(height * width, height * width), dtype=np.int8)
+        self._movement_graph[move_type] = graph
+        return graph
     
+    # Predecessors of every space the unit can reach from start this turn, see get_unblocked_spaces.
+    # Cached until reachability is recomputed around start.
+    def get_path_tree(self, start, unit):
+        key = (start, unit.move_type, unit.move)
+        predecessors = self._path_trees.get(key)
+        if predecessors is None:
+            predecessors = {}
+            self.get_unblocked_spaces(start, unit, self._get_occupied_spaces(), predecessors)
+            self._path_trees[key] = predecessors
+        return predecessors
+
+    # Row-major ids of the spaces from start to end, both included, or [] if end cannot be reached.
+    # Ends within move range are read from the cached path tree, others need a full search of the map.
     def get_shortest_path(self, start, end, unit):
         start_id = start[0] * self.map_width + start[1]
         end_id = end[0] * self.map_width + end[1]
 
+        predecessors = self.get_path_tree(start, unit)
+        if end_id in predecessors:
+            path = [end_id]
+            while predecessors[path[-1]] != -1:
+                path.append(predecessors[path[-1]])
+            path.reverse()
+            return path
+
         current_player = self.get_current_player()
-            
-        occupancy_grid = np.full((self.map_height * self.map_width, self.map_height * self.map_width), 0)
+
+        blocked = np.zeros(self.map_height * self.map_width, dtype=bool)
         for position, other_unit in self.get_all_units().items():
             if other_unit.owner != current_player:
-                occupancy_grid[:,position[0] * self.map_width + position[1]] = 100
-        
-        graph = occupancy_grid + self._terrain_adjacency_matrix[unit.move_type]
-        movement_costs, predecessors = shortest_path(graph, indices=start_id, return_predecessors=True)
+                blocked[position[0] * self.map_width + position[1]] = True
+
+        graph = self.get_movement_graph(unit.move_type).copy()
+        graph.data[blocked[graph.indices]] = 0
+        graph.eliminate_zeros()
+        movement_costs, predecessors = dijkstra(graph, indices=start_id, return_predecessors=True)
+
+        if np.isinf(movement_costs[end_id]):
+            return []
 
         path = []
         cur = end_id
@@ -0,0 +1,24 @@
+SCALARS = ("funds", "co_power", "day", "current_player")
+
+'''
+What changed in a state since its changes were last drained.
+cells are the positions whose unit or property may have changed, units and properties are the cells
+that held a unit or a property before or after the change.
+scalars names the state wide values that changed, out of SCALARS.
+full is set when the changes are unknown (new states, clones, full restores), consumers then rebuild everything.
+'''
+class StateChanges:
+    def __init__(self, full=False):
+        self.full = full
+        self.cells = set()
+        self.units = set()
+        self.properties = set()
+        self.scalars = set()
+
+    def is_empty(self):
+        return not self.full and len(self.cells) == 0 and len(self.scalars) == 0
+
+    def __str__(self) -> str:
+        if self.full:
+            return "All changed"
+        return f"Changed cells {sorted(self.cells)}, scalars {sorted(self.scalars)}"
@@ -1,6 +1,8 @@
 from Game.MoveType import MoveType
 from Game.Unit import UnitInfantry, UnitMech, UnitRecon, UnitTransportCopter, UnitAPC, UnitArtillery, UnitTank, UnitBlackBoat, UnitAntiAir, UnitBattleCopter, UnitMissile, UnitLander, UnitRocket, UnitMediumTank, UnitCruiser, UnitFighter, UnitPiperunner, UnitSubmarine, UnitNeotank, UnitBomber, UnitStealth, UnitBlackBomb, UnitBattleship, UnitMegatank, UnitCarrier
+import bisect
 import math
+import numpy as np
 
 class Terrain(object):
     code = "   "
@@ -26,13 +28,39 @@ class Property(Terrain):
         MoveType.PIPE:0
     }
     buildables = []
+    # Move types of the units this property repairs and resupplies at the start of its owner's turn
+    repairs = {
+        MoveType.FOOT,
+        MoveType.BOOT,
+        MoveType.THREADS,
+        MoveType.TIRES,
+        MoveType.PIPE
+    }
+    # Called with the property and its previous owner whenever the owner changes
+    owner_listener = None
 
     def __init__(self, owner, capture_amount=20):
         super().__init__()
 
-        self.owner = owner
+        self._owner = owner
         self.capture_amount = capture_amount
 
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, owner):
+        previous_owner = self._owner
+        self._owner = owner
+        if self.owner_listener is not None and previous_owner != owner:
+            self.owner_listener(self, previous_owner)
+
+    # Buildables whose cost is within funds, read as a prefix of the buildables sorted by cost
+    @classmethod
+    def get_affordable_buildables(cls, funds):
+        return cls.buildables_by_cost[:bisect.bisect_right(cls.buildable_costs, funds)]
+
     def change_capture(self, new_owner, amount):
         self.capture_amount = min(20, math.floor(self.capture_amount + amount))
         if self.capture_amount <= 0:
@@ -45,6 +73,8 @@ class Property(Terrain):
 '''
 Defines a set of terrain that can be used in a game, and creates instances of the terrain for the game.
 A new subclass should be created for terrain sets catering to specific game formats and requirements
+Only properties hold state, every other terrain type has a single shared instance per library.
+Terrain types are also numbered so maps can be stored as id grids and looked up in the cost and defense tables.
 '''
 class TerrainLibrary:
     def __init__(self, players, available_terrain):
@@ -52,6 +82,12 @@ class TerrainLibrary:
         players = players.copy()
         players.append('N')
         self._code_to_cls = {terrain_class.code.replace('.', player): terrain_class for terrain_class in self.available_terrain for player in players}
+        self._shared_terrain = {}
+
+        self.terrain_index = {terrain_class: i for i, terrain_class in enumerate(self.available_terrain)}
+        # (terrain id, MoveType) cost of entering a tile, 0 if it cannot be entered
+        self.move_cost_table = np.array([[terrain_class.costs.get(move_type, 0) for move_type in MoveType] for terrain_class in self.available_terrain], dtype=np.int8)
+        self.defense_table = np.array([terrain_class.defense for terrain_class in self.available_terrain], dtype=np.int8)
 
     def create(self, terrain_code):
         if terrain_code not in self._code_to_cls:
@@ -61,7 +97,21 @@ class TerrainLibrary:
         if issubclass(terrain_type, Property):
             return terrain_type(owner=terrain_code[0])
         else:
-            return terrain_type()
+            if terrain_type not in self._shared_terrain:
+                self._shared_terrain[terrain_type] = terrain_type()
+            return self._shared_terrain[terrain_type]
+
+    def get_terrain_ids(self, terrain):
+        return np.array([[self.terrain_index[type(tile)] for tile in row] for row in terrain], dtype=np.int16)
+
+    # Per move type (height, width) cost grids for a terrain id grid
+    def get_move_costs(self, terrain_ids):
+        move_costs = np.ascontiguousarray(np.moveaxis(self.move_cost_table[terrain_ids], -1, 0))
+        return {move_type: move_costs[i] for i, move_type in enumerate(MoveType)}
+
+    # (height, width) defense star grid for a terrain id grid
+    def get_defense(self, terrain_ids):
+        return self.defense_table[terrain_ids]
 
 class TerrainPlain(Terrain):
     code="PLN"
@@ -223,6 +273,9 @@ class TerrainBase(Property):
     }
 class TerrainAirport(Property):
     code=".AP"
+    repairs = {
+        MoveType.AIR
+    }
     buildables = {
         UnitTransportCopter,
         UnitBattleCopter,
@@ -233,6 +286,10 @@ class TerrainAirport(Property):
     }
 class TerrainPort(Property):
     code=".PO"
+    repairs = {
+        MoveType.SEA,
+        MoveType.LANDER
+    }
     costs={
         MoveType.FOOT:1,
         MoveType.BOOT:1,
@@ -256,6 +313,11 @@ class TerrainLab(Property):
 class TerrainCommTower(Property):
     code=".CM"
 
+# Buildables sorted by cost, filled in once every property class exists
+for property_class in [Property] + Property.__subclasses__():
+    property_class.buildables_by_cost = tuple(sorted(property_class.buildables, key=lambda unit_type: (unit_type.cost, unit_type.code)))
+    property_class.buildable_costs = tuple(unit_type.cost for unit_type in property_class.buildables_by_cost)
+
 standard_terrain = [
     TerrainPlain,
     TerrainMountains,
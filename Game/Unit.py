@@ -1,28 +1,39 @@
 from Game.MoveType import MoveType
 import math
 
+'''
+Stats shared by every unit of a type are class attributes, instances only hold the fields that change during a game.
+'''
 class Unit:
+    __slots__ = ("_store", "_slot", "owner", "move", "_health", "_fuel", "_ammo", "_available", "in_load")
+
     code = "   "
+    base_move = 0
+    max_health = 100
+    max_ammo = 0
+    max_fuel = 0
+    daily_fuel = 0
+    vision = 0
+    range = set()
+    move_type = MoveType.FOOT
+    cost = 0
+    load_capacity = 0
+    loadables = set()
+    attack_table = {}
+    can_capture = False
+    can_repair = False
+    repair_amount = 0
+
     def __init__(self, owner):
+        # Unit store slot while on the board, writes to the fields below are mirrored into it
+        self._store = None
+        self._slot = -1
         self.owner = owner
-        self.move = 0
-        self.max_health = 100
+        self.move = self.base_move
         self.health = self.max_health
-        self.max_ammo = 0
         self.ammo = self.max_ammo
-        self.max_fuel = 0
         self.fuel = self.max_fuel
-        self.daily_fuel = 0 
-        self.vision = 0
-        self.range = set()
-        self.move_type = MoveType.FOOT
-        self.cost = 0
-        self.load_capacity = 0
-        self.loadables = set()
         self.in_load = []
-        self.attack_table = {}
-        self.can_capture = False
-        self.can_repair = False
         self.available = True
 
     def initialize(self, health=None, fuel=None, ammo=None, to_load=None):
@@ -54,6 +65,46 @@ class Unit:
                 raise Exception("Provided load is invalid")
             self.in_load = to_load
 
+    @property
+    def health(self):
+        return self._health
+
+    @health.setter
+    def health(self, health):
+        self._health = health
+        if self._store is not None:
+            self._store.health[self._slot] = health
+
+    @property
+    def fuel(self):
+        return self._fuel
+
+    @fuel.setter
+    def fuel(self, fuel):
+        self._fuel = fuel
+        if self._store is not None:
+            self._store.fuel[self._slot] = fuel
+
+    @property
+    def ammo(self):
+        return self._ammo
+
+    @ammo.setter
+    def ammo(self, ammo):
+        self._ammo = ammo
+        if self._store is not None:
+            self._store.ammo[self._slot] = ammo
+
+    @property
+    def available(self):
+        return self._available
+
+    @available.setter
+    def available(self, available):
+        self._available = available
+        if self._store is not None:
+            self._store.available[self._slot] = available
+
     def change_fuel(self, amount):
         self.fuel = max(0, min(self.max_fuel, self.fuel + amount))
 
@@ -79,16 +130,33 @@ class Unit:
     def load(self, unit):
         if self.can_load(unit):
             self.in_load.append(unit)
+            if self._store is not None:
+                self._store.update_cargo(self)
 
     def can_unload(self, idx):
         return len(self.in_load) > idx
 
     def unload(self, idx):
-        return self.in_load.pop(idx) if len(self.in_load) > idx else None
+        if len(self.in_load) <= idx:
+            return None
+
+        unit = self.in_load.pop(idx)
+        if self._store is not None:
+            self._store.update_cargo(self)
+        return unit
 
     def get_display_health(self):
         return math.ceil(self.health / 10)
 
+    def get_status(self):
+        return (self.health, self.fuel, self.ammo, self.move, self.available, tuple(self.in_load))
+
+    def set_status(self, status):
+        self.health, self.fuel, self.ammo, self.move, self.available, in_load = status
+        self.in_load = list(in_load)
+        if self._store is not None:
+            self._store.update_cargo(self)
+
     def __str__(self):
         return self.code
 
@@ -100,757 +168,761 @@ class UnitLibrary:
         self.available_unit = available_units
         self._code_to_cls = {unit_class.code: unit_class for unit_class in self.available_unit}
 
-    def create(self, unit_code, owner, health=None, fuel=None, ammo=None, to_load=None):
+    def get_class(self, unit_code):
         if unit_code not in self._code_to_cls:
             raise Exception(f"{unit_code} is not an available unit")
-        new_unit = self._code_to_cls[unit_code](owner)
+        return self._code_to_cls[unit_code]
+
+    def create(self, unit_code, owner, health=None, fuel=None, ammo=None, to_load=None):
+        new_unit = self.get_class(unit_code)(owner)
         new_unit.initialize(health, fuel, ammo, to_load)
         return new_unit
 
 class UnitInfantry(Unit):
+    __slots__ = ()
     code = "INF"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 3
-        self.max_ammo = 0
-        self.max_fuel = 99
-        self.daily_fuel = 0
-        self.vision = 2
-        self.range = {1}
-        self.move_type = MoveType.FOOT
-        self.cost = 1000
-        self.can_capture = True
-        self.attack_table = {
-            UnitAntiAir: (5, 0),
-            UnitAPC: (14, 0),
-            UnitArtillery: (15, 0),
-            UnitBattleCopter: (7, 0),
-            UnitInfantry: (55, 0),
-            UnitMediumTank: (1, 0),
-            UnitMech: (45, 0),
-            UnitMegatank: (1, 0),
-            UnitMissile: (26, 0),
-            UnitNeotank: (1, 0),
-            UnitPiperunner: (5, 0),
-            UnitRecon: (12, 0),
-            UnitRocket: (25, 0),
-            UnitTransportCopter: (30, 0),
-            UnitTank: (5, 0)
-        }
+    base_move = 3
+    max_ammo = 0
+    max_fuel = 99
+    daily_fuel = 0
+    vision = 2
+    range = {1}
+    move_type = MoveType.FOOT
+    cost = 1000
+    can_capture = True
 
 class UnitMech(Unit):
+    __slots__ = ()
     code = "MEC"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 2
-        self.max_ammo = 3
-        self.max_fuel = 70
-        self.daily_fuel = 0
-        self.vision = 2
-        self.range = {1}
-        self.move_type = MoveType.BOOT
-        self.cost = 3000
-        self.can_capture = True
-        self.attack_table = {
-            UnitAntiAir: (65, 1),
-            UnitAPC: (75, 1),
-            UnitArtillery: (70, 1),
-            UnitBattleCopter: (9, 0),
-            UnitInfantry: (65, 0),
-            UnitMediumTank: (15, 1),
-            UnitMech: (55, 0),
-            UnitMegatank: (5, 1),
-            UnitMissile: (85, 1),
-            UnitNeotank: (15, 1),
-            UnitPiperunner: (55, 1),
-            UnitRecon: (85, 1),
-            UnitRocket: (85, 1),
-            UnitTransportCopter: (35, 0),
-            UnitTank: (55, 1)
-        }
+    base_move = 2
+    max_ammo = 3
+    max_fuel = 70
+    daily_fuel = 0
+    vision = 2
+    range = {1}
+    move_type = MoveType.BOOT
+    cost = 3000
+    can_capture = True
 
 class UnitRecon(Unit):
+    __slots__ = ()
     code = "REC"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 8
-        self.max_ammo = 0
-        self.max_fuel = 80
-        self.daily_fuel = 0
-        self.vision = 5
-        self.range = {1}
-        self.move_type = MoveType.TIRES
-        self.cost = 4000
-        self.attack_table = {
-            UnitAntiAir: (4, 0),
-            UnitAPC: (45, 0),
-            UnitArtillery: (45, 0),
-            UnitBattleCopter: (12, 0),
-            UnitInfantry: (70, 0),
-            UnitMediumTank: (1, 0),
-            UnitMech: (65, 0),
-            UnitMegatank: (1, 0),
-            UnitMissile: (28, 0),
-            UnitNeotank: (1, 0),
-            UnitPiperunner: (6, 0),
-            UnitRecon: (35, 0),
-            UnitRocket: (55, 0),
-            UnitTransportCopter: (35, 0),
-            UnitTank: (6, 0)
-        }
-    
+    base_move = 8
+    max_ammo = 0
+    max_fuel = 80
+    daily_fuel = 0
+    vision = 5
+    range = {1}
+    move_type = MoveType.TIRES
+    cost = 4000
 
 class UnitTransportCopter(Unit):
+    __slots__ = ()
     code = "TCP"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 0
-        self.max_fuel = 99
-        self.daily_fuel = 2
-        self.vision = 2
-        self.range = {0}
-        self.move_type = MoveType.AIR
-        self.cost = 5000
-        self.load_capacity = 1
-        self.loadables = {
-            UnitInfantry,
-            UnitMech
-        }
+    base_move = 6
+    max_ammo = 0
+    max_fuel = 99
+    daily_fuel = 2
+    vision = 2
+    range = {0}
+    move_type = MoveType.AIR
+    cost = 5000
+    load_capacity = 1
 
 class UnitAPC(Unit):
+    __slots__ = ()
     code = "APC"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 0
-        self.max_fuel = 70
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {0}
-        self.move_type = MoveType.THREADS
-        self.cost = 5000
-        self.load_capacity = 1
-        self.can_repair = True
-        self.repair_amount = 0 # Can only resupply
-        self.loadables = {
-            UnitInfantry,
-            UnitMech
-        }
+    base_move = 6
+    max_ammo = 0
+    max_fuel = 70
+    daily_fuel = 0
+    vision = 1
+    range = {0}
+    move_type = MoveType.THREADS
+    cost = 5000
+    load_capacity = 1
+    can_repair = True
+    repair_amount = 0 # Can only resupply
 
 class UnitArtillery(Unit):
+    __slots__ = ()
     code = "ATY"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 9
-        self.max_fuel = 50
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {2,3}
-        self.move_type = MoveType.THREADS
-        self.cost = 6000
-        self.attack_table = {
-            UnitAntiAir: (75, 1),
-            UnitAPC: (70, 1),
-            UnitArtillery: (75, 1),
-            UnitBattleship: (40, 1),
-            UnitBlackBoat: (55, 1),
-            UnitCarrier: (45, 1),
-            UnitCruiser: (65, 1),
-            UnitInfantry: (90, 1),
-            UnitLander: (55, 1),
-            UnitMediumTank: (45, 1),
-            UnitMech: (85, 1),
-            UnitMegatank: (15, 1),
-            UnitMissile: (80, 1),
-            UnitNeotank: (40, 1),
-            UnitPiperunner: (70, 1),
-            UnitRecon: (80, 1),
-            UnitRocket: (80, 1),
-            UnitSubmarine: (60, 1),
-            UnitTank: (70, 1)
-        }
+    base_move = 5
+    max_ammo = 9
+    max_fuel = 50
+    daily_fuel = 0
+    vision = 1
+    range = {2,3}
+    move_type = MoveType.THREADS
+    cost = 6000
 
 class UnitTank(Unit):
+    __slots__ = ()
     code = "TNK"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 9
-        self.max_fuel = 70
-        self.daily_fuel = 0
-        self.vision = 3
-        self.range = {1}
-        self.move_type = MoveType.THREADS
-        self.cost = 7000
-        self.attack_table = {
-            UnitAntiAir: (65, 1),
-            UnitAPC: (75, 1),
-            UnitArtillery: (70, 1),
-            UnitBattleCopter: (10, 0),
-            UnitBattleship: (1, 1),
-            UnitBlackBoat: (10, 1),
-            UnitCarrier: (1, 1),
-            UnitCruiser: (5, 1),
-            UnitInfantry: (75, 0),
-            UnitLander: (10, 1),
-            UnitMediumTank: (15, 1),
-            UnitMech: (70, 0),
-            UnitMegatank: (10, 1),
-            UnitMissile: (85, 1),
-            UnitNeotank: (15, 1),
-            UnitPiperunner: (55, 1),
-            UnitRecon: (85, 1),
-            UnitRocket: (85, 1),
-            UnitSubmarine: (1, 1),
-            UnitTransportCopter: (40, 0),
-            UnitTank: (55, 1)
-        }
+    base_move = 6
+    max_ammo = 9
+    max_fuel = 70
+    daily_fuel = 0
+    vision = 3
+    range = {1}
+    move_type = MoveType.THREADS
+    cost = 7000
 
 class UnitBlackBoat(Unit):
+    __slots__ = ()
     code = "BLB"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 7
-        self.max_ammo = 0
-        self.max_fuel = 50
-        self.daily_fuel = 1
-        self.vision = 1
-        self.range = {0}
-        self.move_type = MoveType.LANDER
-        self.cost = 7500
-        self.load_capacity = 2
-        self.can_repair = True
-        self.repair_amount = 1
-        self.loadables = {
-            UnitInfantry,
-            UnitMech
-        }
-    
+    base_move = 7
+    max_ammo = 0
+    max_fuel = 50
+    daily_fuel = 1
+    vision = 1
+    range = {0}
+    move_type = MoveType.LANDER
+    cost = 7500
+    load_capacity = 2
+    can_repair = True
+    repair_amount = 1
+
 class UnitAntiAir(Unit):
+    __slots__ = ()
     code = "AAR"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 9
-        self.max_fuel = 60
-        self.daily_fuel = 0
-        self.vision = 2
-        self.range = {1}
-        self.move_type = MoveType.THREADS
-        self.cost = 8000
-        self.attack_table = {
-            UnitAntiAir: (45, 1),
-            UnitAPC: (50, 1),
-            UnitArtillery: (50, 1),
-            UnitBattleCopter: (120, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (75, 1),
-            UnitFighter: (65, 1),
-            UnitInfantry: (105, 1),
-            UnitMediumTank: (10, 1),
-            UnitMech: (105, 1),
-            UnitMegatank: (1, 1),
-            UnitMissile: (55, 1),
-            UnitNeotank: (5, 1),
-            UnitPiperunner: (25, 1),
-            UnitRecon: (60, 1),
-            UnitRocket: (55, 1),
-            UnitStealth: (75, 1),
-            UnitTransportCopter: (120, 1),
-            UnitTank: (25, 1)
-        }
+    base_move = 6
+    max_ammo = 9
+    max_fuel = 60
+    daily_fuel = 0
+    vision = 2
+    range = {1}
+    move_type = MoveType.THREADS
+    cost = 8000
 
 class UnitBattleCopter(Unit):
+    __slots__ = ()
     code = "BCP"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 6
-        self.max_fuel = 99
-        self.daily_fuel = 2
-        self.vision = 3
-        self.range = {1}
-        self.move_type = MoveType.AIR
-        self.cost = 9000
-        self.attack_table = {
-            UnitAntiAir: (25, 1),
-            UnitAPC: (60, 1),
-            UnitArtillery: (65, 1),
-            UnitBattleCopter: (65, 1),
-            UnitBattleship: (25, 1),
-            UnitBlackBoat: (25, 1),
-            UnitCarrier: (25, 1),
-            UnitCruiser: (55, 1),
-            UnitInfantry: (75, 0),
-            UnitLander: (25, 1),
-            UnitMediumTank: (25, 1),
-            UnitMech: (75, 0),
-            UnitMegatank: (10, 1),
-            UnitMissile: (65, 1),
-            UnitNeotank: (20, 1),
-            UnitPiperunner: (55, 1),
-            UnitRecon: (55, 1),
-            UnitRocket: (65, 1),
-            UnitSubmarine: (25, 1),
-            UnitTransportCopter: (95, 0),
-            UnitTank: (55, 1)
-        }
+    base_move = 6
+    max_ammo = 6
+    max_fuel = 99
+    daily_fuel = 2
+    vision = 3
+    range = {1}
+    move_type = MoveType.AIR
+    cost = 9000
 
 class UnitMissile(Unit):
+    __slots__ = ()
     code = "MIS"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 4
-        self.max_ammo = 6
-        self.max_fuel = 50
-        self.daily_fuel = 0
-        self.vision = 5
-        self.range = {3,4,5}
-        self.move_type = MoveType.TIRES
-        self.cost = 12000
-        self.attack_table = {
-            UnitBattleCopter: (120, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (100, 1),
-            UnitFighter: (100, 1),
-            UnitStealth: (100, 1),
-            UnitTransportCopter: (120, 1),
-        }
+    base_move = 4
+    max_ammo = 6
+    max_fuel = 50
+    daily_fuel = 0
+    vision = 5
+    range = {3,4,5}
+    move_type = MoveType.TIRES
+    cost = 12000
 
 class UnitRocket(Unit):
+    __slots__ = ()
     code = "ROK"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 6
-        self.max_fuel = 50
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {3,4,5}
-        self.move_type = MoveType.TIRES
-        self.cost = 15000
-        self.attack_table = {
-            UnitAntiAir: (85, 1),
-            UnitAPC: (80, 1),
-            UnitArtillery: (80, 1),
-            UnitBattleship: (55, 1),
-            UnitBlackBoat: (60, 1),
-            UnitCarrier: (60, 1),
-            UnitCruiser: (85, 1),
-            UnitInfantry: (95, 1),
-            UnitLander: (60, 1),
-            UnitMediumTank: (55, 1),
-            UnitMech: (90, 1),
-            UnitMegatank: (25, 1),
-            UnitMissile: (90, 1),
-            UnitNeotank: (50, 1),
-            UnitPiperunner: (80, 1),
-            UnitRecon: (90, 1),
-            UnitRocket: (85, 1),
-            UnitSubmarine: (85, 1),
-            UnitTank: (80, 1)
-        }
+    base_move = 5
+    max_ammo = 6
+    max_fuel = 50
+    daily_fuel = 0
+    vision = 1
+    range = {3,4,5}
+    move_type = MoveType.TIRES
+    cost = 15000
 
 class UnitMediumTank(Unit):
+    __slots__ = ()
     code = "MTK"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 8
-        self.max_fuel = 50
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {1}
-        self.move_type = MoveType.THREADS
-        self.cost = 16000
-        self.attack_table = {
-            UnitAntiAir: (105, 1),
-            UnitAPC: (105, 1),
-            UnitArtillery: (105, 1),
-            UnitBattleCopter: (12, 0),
-            UnitBattleship: (10, 1),
-            UnitBlackBoat: (35, 1),
-            UnitCarrier: (10, 1),
-            UnitCruiser: (45, 1),
-            UnitInfantry: (105, 0),
-            UnitLander: (35, 1),
-            UnitMediumTank: (55, 1),
-            UnitMech: (95, 0),
-            UnitMegatank: (25, 1),
-            UnitMissile: (105, 1),
-            UnitNeotank: (45, 1),
-            UnitPiperunner: (85, 1),
-            UnitRecon: (105, 1),
-            UnitRocket: (105, 1),
-            UnitSubmarine: (10, 1),
-            UnitTransportCopter: (45, 0),
-            UnitTank: (85, 1)
-        }
+    base_move = 5
+    max_ammo = 8
+    max_fuel = 50
+    daily_fuel = 0
+    vision = 1
+    range = {1}
+    move_type = MoveType.THREADS
+    cost = 16000
 
 class UnitCruiser(Unit):
+    __slots__ = ()
     code = "CRU"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 1
-        self.vision = 3
-        self.range = {1}
-        self.move_type = MoveType.SEA
-        self.cost = 18000
-        self.load_capacity = 2
-        self.loadables = {
-            UnitTransportCopter,
-            UnitBattleCopter
-        }
-        self.attack_table = {
-            UnitBattleCopter: (115, 0),
-            UnitBlackBoat: (25, 1),
-            UnitBlackBomb: (120, 0),
-            UnitBomber: (65, 0),
-            UnitCarrier: (5, 1),
-            UnitFighter: (55, 0),
-            UnitStealth: (100, 0),
-            UnitSubmarine: (90, 1),
-            UnitTransportCopter: (115, 0),
-        }
+    base_move = 6
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 1
+    vision = 3
+    range = {1}
+    move_type = MoveType.SEA
+    cost = 18000
+    load_capacity = 2
 
 class UnitFighter(Unit):
+    __slots__ = ()
     code = "FGT"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 9
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 5
-        self.vision = 2
-        self.range = {1}
-        self.move_type = MoveType.AIR
-        self.cost = 20000
-        self.attack_table = {
-            UnitBattleCopter: (100, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (100, 1),
-            UnitFighter: (55, 1),
-            UnitStealth: (85, 1),
-            UnitTransportCopter: (100, 1),
-        }
+    base_move = 9
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 5
+    vision = 2
+    range = {1}
+    move_type = MoveType.AIR
+    cost = 20000
 
 class UnitPiperunner(Unit):
+    __slots__ = ()
     code = "PRN"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 9
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 0
-        self.vision = 4
-        self.range = {2,3,4,5}
-        self.move_type = MoveType.PIPE
-        self.cost = 20000
-        self.attack_table = {
-            UnitAntiAir: (85, 1),
-            UnitAPC: (80, 1),
-            UnitArtillery: (80, 1),
-            UnitBattleCopter: (105, 1),
-            UnitBattleship: (55, 1),
-            UnitBlackBoat: (60, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (75, 1),
-            UnitCarrier: (60, 1),
-            UnitCruiser: (85, 1),
-            UnitFighter: (65, 1),
-            UnitInfantry: (95, 1),
-            UnitLander: (60, 1),
-            UnitMediumTank: (55, 1),
-            UnitMech: (90, 1),
-            UnitMegatank: (25, 1),
-            UnitMissile: (90, 1),
-            UnitNeotank: (50, 1),
-            UnitPiperunner: (80, 1),
-            UnitRecon: (90, 1),
-            UnitRocket: (85, 1),
-            UnitStealth: (75, 1),
-            UnitSubmarine: (85, 1),
-            UnitTransportCopter: (105, 1),
-            UnitTank: (80, 1)
-        }
+    base_move = 9
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 0
+    vision = 4
+    range = {2,3,4,5}
+    move_type = MoveType.PIPE
+    cost = 20000
 
 class UnitSubmarine(Unit):
+    __slots__ = ()
     code = "SUB"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 6
-        self.max_fuel = 60
-        self.daily_fuel = 1
-        self.vision = 5
-        self.range = {1}
-        self.move_type = MoveType.SEA
-        self.cost = 20000
-        self.attack_table = {
-            UnitBattleship: (55, 1),
-            UnitBlackBoat: (95, 1),
-            UnitCarrier: (75, 1),
-            UnitCruiser: (25, 1),
-            UnitLander: (95, 1),
-            UnitSubmarine: (55, 1),
-        }
+    base_move = 5
+    max_ammo = 6
+    max_fuel = 60
+    daily_fuel = 1
+    vision = 5
+    range = {1}
+    move_type = MoveType.SEA
+    cost = 20000
 
 class UnitNeotank(Unit):
+    __slots__ = ()
     code = "NTK"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {1}
-        self.move_type = MoveType.THREADS
-        self.cost = 22000
-        self.attack_table = {
-            UnitAntiAir: (115, 1),
-            UnitAPC: (125, 1),
-            UnitArtillery: (115, 1),
-            UnitBattleCopter: (22, 0),
-            UnitBattleship: (15, 1),
-            UnitBlackBoat: (40, 1),
-            UnitCarrier: (15, 1),
-            UnitCruiser: (50, 1),
-            UnitInfantry: (125, 0),
-            UnitLander: (50, 1),
-            UnitMediumTank: (75, 1),
-            UnitMech: (115, 0),
-            UnitMegatank: (35, 1),
-            UnitMissile: (125, 1),
-            UnitNeotank: (55, 1),
-            UnitPiperunner: (105, 1),
-            UnitRecon: (125, 1),
-            UnitRocket: (125, 1),
-            UnitSubmarine: (15, 1),
-            UnitTransportCopter: (55, 0),
-            UnitTank: (105, 1)
-        }
+    base_move = 6
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 0
+    vision = 1
+    range = {1}
+    move_type = MoveType.THREADS
+    cost = 22000
 
 class UnitBomber(Unit):
+    __slots__ = ()
     code = "BMB"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 7
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 5
-        self.vision = 2
-        self.range = {1}
-        self.move_type = MoveType.AIR
-        self.cost = 22000
-        self.attack_table = {
-            UnitAntiAir: (95, 1),
-            UnitAPC: (105, 1),
-            UnitArtillery: (105, 1),
-            UnitBattleship: (75, 1),
-            UnitBlackBoat: (95, 1),
-            UnitCarrier: (75, 1),
-            UnitCruiser: (85, 1),
-            UnitInfantry: (110, 1),
-            UnitLander: (95, 1),
-            UnitMediumTank: (95, 1),
-            UnitMech: (110, 1),
-            UnitMegatank: (35, 1),
-            UnitMissile: (105, 1),
-            UnitNeotank: (90, 1),
-            UnitPiperunner: (105, 1),
-            UnitRecon: (105, 1),
-            UnitRocket: (105, 1),
-            UnitSubmarine: (95, 1),
-            UnitTank: (105, 1)
-        }
+    base_move = 7
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 5
+    vision = 2
+    range = {1}
+    move_type = MoveType.AIR
+    cost = 22000
 
 class UnitStealth(Unit):
+    __slots__ = ()
     code = "STH"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 6
-        self.max_fuel = 60
-        self.daily_fuel = 5
-        self.vision = 4
-        self.range = {1}
-        self.move_type = MoveType.AIR
-        self.cost = 24000
-        self.attack_table = {
-            UnitAntiAir: (50, 1),
-            UnitAPC: (85, 1),
-            UnitArtillery: (75, 1),
-            UnitBattleCopter: (85, 1),
-            UnitBattleship: (45, 1),
-            UnitBlackBoat: (65, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (70, 1),
-            UnitCarrier: (45, 1),
-            UnitCruiser: (35, 1),
-            UnitFighter: (45, 1),
-            UnitInfantry: (90, 1),
-            UnitLander: (65, 1),
-            UnitMediumTank: (70, 1),
-            UnitMech: (90, 1),
-            UnitMegatank: (15, 1),
-            UnitMissile: (85, 1),
-            UnitNeotank: (60, 1),
-            UnitPiperunner: (80, 1),
-            UnitRecon: (85, 1),
-            UnitRocket: (85, 1),
-            UnitStealth: (55, 1),
-            UnitSubmarine: (55, 1),
-            UnitTransportCopter: (95, 1),
-            UnitTank: (75, 1)
-        }
+    base_move = 6
+    max_ammo = 6
+    max_fuel = 60
+    daily_fuel = 5
+    vision = 4
+    range = {1}
+    move_type = MoveType.AIR
+    cost = 24000
 
 class UnitBlackBomb(Unit):
+    __slots__ = ()
     code = "BBB"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 9
-        self.max_ammo = 0
-        self.max_fuel = 45
-        self.daily_fuel = 5
-        self.vision = 1
-        self.range = {0}
-        self.move_type = MoveType.AIR
-        self.cost = 25000
-        
+    base_move = 9
+    max_ammo = 0
+    max_fuel = 45
+    daily_fuel = 5
+    vision = 1
+    range = {0}
+    move_type = MoveType.AIR
+    cost = 25000
+
 class UnitBattleship(Unit):
+    __slots__ = ()
     code = "BSP"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 1
-        self.vision = 2
-        self.range = {2,3,4,5,6}
-        self.move_type = MoveType.SEA
-        self.cost = 28000
-        self.attack_table = {
-            UnitAntiAir: (85, 1),
-            UnitAPC: (80, 1),
-            UnitArtillery: (80, 1),
-            UnitBattleship: (50, 1),
-            UnitBlackBoat: (95, 1),
-            UnitCarrier: (60, 1),
-            UnitCruiser: (95, 1),
-            UnitInfantry: (95, 1),
-            UnitLander: (95, 1),
-            UnitMediumTank: (55, 1),
-            UnitMech: (90, 1),
-            UnitMegatank: (25, 1),
-            UnitMissile: (90, 1),
-            UnitNeotank: (50, 1),
-            UnitPiperunner: (80, 1),
-            UnitRecon: (90, 1),
-            UnitRocket: (85, 1),
-            UnitSubmarine: (95, 1),
-            UnitTank: (80, 1)
-        }
+    base_move = 5
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 1
+    vision = 2
+    range = {2,3,4,5,6}
+    move_type = MoveType.SEA
+    cost = 28000
 
 class UnitMegatank(Unit):
+    __slots__ = ()
     code = "MGT"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 4
-        self.max_ammo = 3
-        self.max_fuel = 50
-        self.daily_fuel = 0
-        self.vision = 1
-        self.range = {1}
-        self.move_type = MoveType.THREADS
-        self.cost = 28000
-        self.attack_table = {
-            UnitAntiAir: (195, 1),
-            UnitAPC: (195, 1),
-            UnitArtillery: (195, 1),
-            UnitBattleCopter: (22, 0),
-            UnitBattleship: (45, 1),
-            UnitBlackBoat: (105, 1),
-            UnitCarrier: (45, 1),
-            UnitCruiser: (65, 1),
-            UnitInfantry: (135, 0),
-            UnitLander: (75, 1),
-            UnitMediumTank: (125, 1),
-            UnitMech: (125, 0),
-            UnitMegatank: (65, 1),
-            UnitMissile: (195, 1),
-            UnitNeotank: (115, 1),
-            UnitPiperunner: (180, 1),
-            UnitRecon: (195, 1),
-            UnitRocket: (195, 1),
-            UnitSubmarine: (45, 1),
-            UnitTransportCopter: (55, 0),
-            UnitTank: (180, 1)
-        }
+    base_move = 4
+    max_ammo = 3
+    max_fuel = 50
+    daily_fuel = 0
+    vision = 1
+    range = {1}
+    move_type = MoveType.THREADS
+    cost = 28000
 
 class UnitCarrier(Unit):
+    __slots__ = ()
     code = "CAR"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 5
-        self.max_ammo = 9
-        self.max_fuel = 99
-        self.daily_fuel = 1
-        self.vision = 4
-        self.range = {3,4,5,6,7,8}
-        self.move_type = MoveType.SEA
-        self.cost = 30000
-        self.load_capacity = 2
-        self.loadables = {
-            UnitTransportCopter,
-            UnitBattleCopter,
-            UnitFighter,
-            UnitBomber,
-            UnitBlackBomb,
-            UnitStealth
-        }
-        self.attack_table = {
-            UnitBattleCopter: (115, 1),
-            UnitBlackBomb: (120, 1),
-            UnitBomber: (100, 1),
-            UnitFighter: (100, 1),
-            UnitStealth: (100, 1),
-            UnitTransportCopter: (115, 1)
-        }
+    base_move = 5
+    max_ammo = 9
+    max_fuel = 99
+    daily_fuel = 1
+    vision = 4
+    range = {3,4,5,6,7,8}
+    move_type = MoveType.SEA
+    cost = 30000
+    load_capacity = 2
 
 class UnitLander(Unit):
+    __slots__ = ()
     code = "LND"
-    def __init__(self, owner):
-        super().__init__(owner)
-        self.move = 6
-        self.max_ammo = 0
-        self.max_fuel = 99
-        self.daily_fuel = 1
-        self.vision = 1
-        self.range = {0}
-        self.move_type = MoveType.LANDER
-        self.cost = 12000
-        self.load_capacity = 2
-        self.loadables = {
-            UnitInfantry,
-            UnitMech,
-            UnitAntiAir,
-            UnitMissile,
-            UnitAPC,
-            UnitArtillery,
-            UnitRocket,
-            UnitAPC,
-            UnitRecon,
-            UnitTank,
-            UnitMediumTank,
-            UnitNeotank,
-            UnitMegatank,
-        }
+    base_move = 6
+    max_ammo = 0
+    max_fuel = 99
+    daily_fuel = 1
+    vision = 1
+    range = {0}
+    move_type = MoveType.LANDER
+    cost = 12000
+    load_capacity = 2
+
+# Attack tables and loadables refer to unit classes, so they are filled in once every class exists
+UnitInfantry.attack_table = {
+    UnitAntiAir: (5, 0),
+    UnitAPC: (14, 0),
+    UnitArtillery: (15, 0),
+    UnitBattleCopter: (7, 0),
+    UnitInfantry: (55, 0),
+    UnitMediumTank: (1, 0),
+    UnitMech: (45, 0),
+    UnitMegatank: (1, 0),
+    UnitMissile: (26, 0),
+    UnitNeotank: (1, 0),
+    UnitPiperunner: (5, 0),
+    UnitRecon: (12, 0),
+    UnitRocket: (25, 0),
+    UnitTransportCopter: (30, 0),
+    UnitTank: (5, 0)
+}
+
+UnitMech.attack_table = {
+    UnitAntiAir: (65, 1),
+    UnitAPC: (75, 1),
+    UnitArtillery: (70, 1),
+    UnitBattleCopter: (9, 0),
+    UnitInfantry: (65, 0),
+    UnitMediumTank: (15, 1),
+    UnitMech: (55, 0),
+    UnitMegatank: (5, 1),
+    UnitMissile: (85, 1),
+    UnitNeotank: (15, 1),
+    UnitPiperunner: (55, 1),
+    UnitRecon: (85, 1),
+    UnitRocket: (85, 1),
+    UnitTransportCopter: (35, 0),
+    UnitTank: (55, 1)
+}
+
+UnitRecon.attack_table = {
+    UnitAntiAir: (4, 0),
+    UnitAPC: (45, 0),
+    UnitArtillery: (45, 0),
+    UnitBattleCopter: (12, 0),
+    UnitInfantry: (70, 0),
+    UnitMediumTank: (1, 0),
+    UnitMech: (65, 0),
+    UnitMegatank: (1, 0),
+    UnitMissile: (28, 0),
+    UnitNeotank: (1, 0),
+    UnitPiperunner: (6, 0),
+    UnitRecon: (35, 0),
+    UnitRocket: (55, 0),
+    UnitTransportCopter: (35, 0),
+    UnitTank: (6, 0)
+}
+
+UnitTransportCopter.loadables = {
+    UnitInfantry,
+    UnitMech
+}
+
+UnitAPC.loadables = {
+    UnitInfantry,
+    UnitMech
+}
+
+UnitArtillery.attack_table = {
+    UnitAntiAir: (75, 1),
+    UnitAPC: (70, 1),
+    UnitArtillery: (75, 1),
+    UnitBattleship: (40, 1),
+    UnitBlackBoat: (55, 1),
+    UnitCarrier: (45, 1),
+    UnitCruiser: (65, 1),
+    UnitInfantry: (90, 1),
+    UnitLander: (55, 1),
+    UnitMediumTank: (45, 1),
+    UnitMech: (85, 1),
+    UnitMegatank: (15, 1),
+    UnitMissile: (80, 1),
+    UnitNeotank: (40, 1),
+    UnitPiperunner: (70, 1),
+    UnitRecon: (80, 1),
+    UnitRocket: (80, 1),
+    UnitSubmarine: (60, 1),
+    UnitTank: (70, 1)
+}
+
+UnitTank.attack_table = {
+    UnitAntiAir: (65, 1),
+    UnitAPC: (75, 1),
+    UnitArtillery: (70, 1),
+    UnitBattleCopter: (10, 0),
+    UnitBattleship: (1, 1),
+    UnitBlackBoat: (10, 1),
+    UnitCarrier: (1, 1),
+    UnitCruiser: (5, 1),
+    UnitInfantry: (75, 0),
+    UnitLander: (10, 1),
+    UnitMediumTank: (15, 1),
+    UnitMech: (70, 0),
+    UnitMegatank: (10, 1),
+    UnitMissile: (85, 1),
+    UnitNeotank: (15, 1),
+    UnitPiperunner: (55, 1),
+    UnitRecon: (85, 1),
+    UnitRocket: (85, 1),
+    UnitSubmarine: (1, 1),
+    UnitTransportCopter: (40, 0),
+    UnitTank: (55, 1)
+}
+
+UnitBlackBoat.loadables = {
+    UnitInfantry,
+    UnitMech
+}
+
+UnitAntiAir.attack_table = {
+    UnitAntiAir: (45, 1),
+    UnitAPC: (50, 1),
+    UnitArtillery: (50, 1),
+    UnitBattleCopter: (120, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (75, 1),
+    UnitFighter: (65, 1),
+    UnitInfantry: (105, 1),
+    UnitMediumTank: (10, 1),
+    UnitMech: (105, 1),
+    UnitMegatank: (1, 1),
+    UnitMissile: (55, 1),
+    UnitNeotank: (5, 1),
+    UnitPiperunner: (25, 1),
+    UnitRecon: (60, 1),
+    UnitRocket: (55, 1),
+    UnitStealth: (75, 1),
+    UnitTransportCopter: (120, 1),
+    UnitTank: (25, 1)
+}
+
+UnitBattleCopter.attack_table = {
+    UnitAntiAir: (25, 1),
+    UnitAPC: (60, 1),
+    UnitArtillery: (65, 1),
+    UnitBattleCopter: (65, 1),
+    UnitBattleship: (25, 1),
+    UnitBlackBoat: (25, 1),
+    UnitCarrier: (25, 1),
+    UnitCruiser: (55, 1),
+    UnitInfantry: (75, 0),
+    UnitLander: (25, 1),
+    UnitMediumTank: (25, 1),
+    UnitMech: (75, 0),
+    UnitMegatank: (10, 1),
+    UnitMissile: (65, 1),
+    UnitNeotank: (20, 1),
+    UnitPiperunner: (55, 1),
+    UnitRecon: (55, 1),
+    UnitRocket: (65, 1),
+    UnitSubmarine: (25, 1),
+    UnitTransportCopter: (95, 0),
+    UnitTank: (55, 1)
+}
+
+UnitMissile.attack_table = {
+    UnitBattleCopter: (120, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (100, 1),
+    UnitFighter: (100, 1),
+    UnitStealth: (100, 1),
+    UnitTransportCopter: (120, 1),
+}
+
+UnitRocket.attack_table = {
+    UnitAntiAir: (85, 1),
+    UnitAPC: (80, 1),
+    UnitArtillery: (80, 1),
+    UnitBattleship: (55, 1),
+    UnitBlackBoat: (60, 1),
+    UnitCarrier: (60, 1),
+    UnitCruiser: (85, 1),
+    UnitInfantry: (95, 1),
+    UnitLander: (60, 1),
+    UnitMediumTank: (55, 1),
+    UnitMech: (90, 1),
+    UnitMegatank: (25, 1),
+    UnitMissile: (90, 1),
+    UnitNeotank: (50, 1),
+    UnitPiperunner: (80, 1),
+    UnitRecon: (90, 1),
+    UnitRocket: (85, 1),
+    UnitSubmarine: (85, 1),
+    UnitTank: (80, 1)
+}
+
+UnitMediumTank.attack_table = {
+    UnitAntiAir: (105, 1),
+    UnitAPC: (105, 1),
+    UnitArtillery: (105, 1),
+    UnitBattleCopter: (12, 0),
+    UnitBattleship: (10, 1),
+    UnitBlackBoat: (35, 1),
+    UnitCarrier: (10, 1),
+    UnitCruiser: (45, 1),
+    UnitInfantry: (105, 0),
+    UnitLander: (35, 1),
+    UnitMediumTank: (55, 1),
+    UnitMech: (95, 0),
+    UnitMegatank: (25, 1),
+    UnitMissile: (105, 1),
+    UnitNeotank: (45, 1),
+    UnitPiperunner: (85, 1),
+    UnitRecon: (105, 1),
+    UnitRocket: (105, 1),
+    UnitSubmarine: (10, 1),
+    UnitTransportCopter: (45, 0),
+    UnitTank: (85, 1)
+}
+
+UnitCruiser.loadables = {
+    UnitTransportCopter,
+    UnitBattleCopter
+}
+
+UnitCruiser.attack_table = {
+    UnitBattleCopter: (115, 0),
+    UnitBlackBoat: (25, 1),
+    UnitBlackBomb: (120, 0),
+    UnitBomber: (65, 0),
+    UnitCarrier: (5, 1),
+    UnitFighter: (55, 0),
+    UnitStealth: (100, 0),
+    UnitSubmarine: (90, 1),
+    UnitTransportCopter: (115, 0),
+}
+
+UnitFighter.attack_table = {
+    UnitBattleCopter: (100, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (100, 1),
+    UnitFighter: (55, 1),
+    UnitStealth: (85, 1),
+    UnitTransportCopter: (100, 1),
+}
+
+UnitPiperunner.attack_table = {
+    UnitAntiAir: (85, 1),
+    UnitAPC: (80, 1),
+    UnitArtillery: (80, 1),
+    UnitBattleCopter: (105, 1),
+    UnitBattleship: (55, 1),
+    UnitBlackBoat: (60, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (75, 1),
+    UnitCarrier: (60, 1),
+    UnitCruiser: (85, 1),
+    UnitFighter: (65, 1),
+    UnitInfantry: (95, 1),
+    UnitLander: (60, 1),
+    UnitMediumTank: (55, 1),
+    UnitMech: (90, 1),
+    UnitMegatank: (25, 1),
+    UnitMissile: (90, 1),
+    UnitNeotank: (50, 1),
+    UnitPiperunner: (80, 1),
+    UnitRecon: (90, 1),
+    UnitRocket: (85, 1),
+    UnitStealth: (75, 1),
+    UnitSubmarine: (85, 1),
+    UnitTransportCopter: (105, 1),
+    UnitTank: (80, 1)
+}
+
+UnitSubmarine.attack_table = {
+    UnitBattleship: (55, 1),
+    UnitBlackBoat: (95, 1),
+    UnitCarrier: (75, 1),
+    UnitCruiser: (25, 1),
+    UnitLander: (95, 1),
+    UnitSubmarine: (55, 1),
+}
+
+UnitNeotank.attack_table = {
+    UnitAntiAir: (115, 1),
+    UnitAPC: (125, 1),
+    UnitArtillery: (115, 1),
+    UnitBattleCopter: (22, 0),
+    UnitBattleship: (15, 1),
+    UnitBlackBoat: (40, 1),
+    UnitCarrier: (15, 1),
+    UnitCruiser: (50, 1),
+    UnitInfantry: (125, 0),
+    UnitLander: (50, 1),
+    UnitMediumTank: (75, 1),
+    UnitMech: (115, 0),
+    UnitMegatank: (35, 1),
+    UnitMissile: (125, 1),
+    UnitNeotank: (55, 1),
+    UnitPiperunner: (105, 1),
+    UnitRecon: (125, 1),
+    UnitRocket: (125, 1),
+    UnitSubmarine: (15, 1),
+    UnitTransportCopter: (55, 0),
+    UnitTank: (105, 1)
+}
+
+UnitBomber.attack_table = {
+    UnitAntiAir: (95, 1),
+    UnitAPC: (105, 1),
+    UnitArtillery: (105, 1),
+    UnitBattleship: (75, 1),
+    UnitBlackBoat: (95, 1),
+    UnitCarrier: (75, 1),
+    UnitCruiser: (85, 1),
+    UnitInfantry: (110, 1),
+    UnitLander: (95, 1),
+    UnitMediumTank: (95, 1),
+    UnitMech: (110, 1),
+    UnitMegatank: (35, 1),
+    UnitMissile: (105, 1),
+    UnitNeotank: (90, 1),
+    UnitPiperunner: (105, 1),
+    UnitRecon: (105, 1),
+    UnitRocket: (105, 1),
+    UnitSubmarine: (95, 1),
+    UnitTank: (105, 1)
+}
+
+UnitStealth.attack_table = {
+    UnitAntiAir: (50, 1),
+    UnitAPC: (85, 1),
+    UnitArtillery: (75, 1),
+    UnitBattleCopter: (85, 1),
+    UnitBattleship: (45, 1),
+    UnitBlackBoat: (65, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (70, 1),
+    UnitCarrier: (45, 1),
+    UnitCruiser: (35, 1),
+    UnitFighter: (45, 1),
+    UnitInfantry: (90, 1),
+    UnitLander: (65, 1),
+    UnitMediumTank: (70, 1),
+    UnitMech: (90, 1),
+    UnitMegatank: (15, 1),
+    UnitMissile: (85, 1),
+    UnitNeotank: (60, 1),
+    UnitPiperunner: (80, 1),
+    UnitRecon: (85, 1),
+    UnitRocket: (85, 1),
+    UnitStealth: (55, 1),
+    UnitSubmarine: (55, 1),
+    UnitTransportCopter: (95, 1),
+    UnitTank: (75, 1)
+}
+
+UnitBattleship.attack_table = {
+    UnitAntiAir: (85, 1),
+    UnitAPC: (80, 1),
+    UnitArtillery: (80, 1),
+    UnitBattleship: (50, 1),
+    UnitBlackBoat: (95, 1),
+    UnitCarrier: (60, 1),
+    UnitCruiser: (95, 1),
+    UnitInfantry: (95, 1),
+    UnitLander: (95, 1),
+    UnitMediumTank: (55, 1),
+    UnitMech: (90, 1),
+    UnitMegatank: (25, 1),
+    UnitMissile: (90, 1),
+    UnitNeotank: (50, 1),
+    UnitPiperunner: (80, 1),
+    UnitRecon: (90, 1),
+    UnitRocket: (85, 1),
+    UnitSubmarine: (95, 1),
+    UnitTank: (80, 1)
+}
+
+UnitMegatank.attack_table = {
+    UnitAntiAir: (195, 1),
+    UnitAPC: (195, 1),
+    UnitArtillery: (195, 1),
+    UnitBattleCopter: (22, 0),
+    UnitBattleship: (45, 1),
+    UnitBlackBoat: (105, 1),
+    UnitCarrier: (45, 1),
+    UnitCruiser: (65, 1),
+    UnitInfantry: (135, 0),
+    UnitLander: (75, 1),
+    UnitMediumTank: (125, 1),
+    UnitMech: (125, 0),
+    UnitMegatank: (65, 1),
+    UnitMissile: (195, 1),
+    UnitNeotank: (115, 1),
+    UnitPiperunner: (180, 1),
+    UnitRecon: (195, 1),
+    UnitRocket: (195, 1),
+    UnitSubmarine: (45, 1),
+    UnitTransportCopter: (55, 0),
+    UnitTank: (180, 1)
+}
+
+UnitCarrier.loadables = {
+    UnitTransportCopter,
+    UnitBattleCopter,
+    UnitFighter,
+    UnitBomber,
+    UnitBlackBomb,
+    UnitStealth
+}
+
+UnitCarrier.attack_table = {
+    UnitBattleCopter: (115, 1),
+    UnitBlackBomb: (120, 1),
+    UnitBomber: (100, 1),
+    UnitFighter: (100, 1),
+    UnitStealth: (100, 1),
+    UnitTransportCopter: (115, 1)
+}
+
+UnitLander.loadables = {
+    UnitInfantry,
+    UnitMech,
+    UnitAntiAir,
+    UnitMissile,
+    UnitAPC,
+    UnitArtillery,
+    UnitRocket,
+    UnitAPC,
+    UnitRecon,
+    UnitTank,
+    UnitMediumTank,
+    UnitNeotank,
+    UnitMegatank,
+}
 
 standard_units = [
     UnitInfantry,
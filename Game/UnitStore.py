@@ -0,0 +1,134 @@
+import numpy as np
+
+MAX_CARGO = 2
+
+'''
+Struct-of-arrays copy of the units on the board, kept in sync by State and by Unit attribute writes.
+Each unit on the board owns a slot; the occupancy grid maps every space to the slot of the unit on it, or -1.
+Unit objects stay the API for single units, the arrays are for queries over many units at once.
+'''
+class UnitStore:
+    def __init__(self, height, width, players, unit_classes, capacity=32):
+        self.height = height
+        self.width = width
+        self.players = players
+        self.owner_index = {player: i for i, player in enumerate(players)}
+        self.unit_classes = unit_classes
+        self.type_index = {unit_class: i for i, unit_class in enumerate(unit_classes)}
+
+        # Per type stats
+        self.type_cost = np.array([unit_class.cost for unit_class in unit_classes], dtype=np.int32)
+        self.type_max_fuel = np.array([unit_class.max_fuel for unit_class in unit_classes], dtype=np.int32)
+        self.type_max_ammo = np.array([unit_class.max_ammo for unit_class in unit_classes], dtype=np.int32)
+        self.type_attack = np.array([[unit_class.attack_table.get(defender, (0, 0))[0] for defender in unit_classes] for unit_class in unit_classes], dtype=np.int32)
+
+        self.occupancy = np.full((height, width), -1, dtype=np.int32)
+        self.units = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.type_id = np.zeros(capacity, dtype=np.int16)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.row = np.zeros(capacity, dtype=np.int16)
+        self.col = np.zeros(capacity, dtype=np.int16)
+        self.health = np.zeros(capacity, dtype=np.int16)
+        self.fuel = np.zeros(capacity, dtype=np.int16)
+        self.ammo = np.zeros(capacity, dtype=np.int16)
+        self.available = np.zeros(capacity, dtype=bool)
+        self.cargo = np.full((capacity, MAX_CARGO), -1, dtype=np.int16)
+
+    def _grow(self):
+        capacity = len(self.units)
+        self.units.extend([None] * capacity)
+        self.free_slots.extend(range(2 * capacity - 1, capacity - 1, -1))
+        for name in ["alive", "type_id", "owner", "row", "col", "health", "fuel", "ammo", "available", "cargo"]:
+            array = getattr(self, name)
+            grown = np.full((2 * capacity,) + array.shape[1:], -1 if name == "cargo" else 0, dtype=array.dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+
+    def place(self, unit, position):
+        r, c = position
+        occupant_slot = self.occupancy[r, c]
+        if occupant_slot >= 0 and self.units[occupant_slot] is not unit:
+            self.release(occupant_slot)
+
+        if unit._store is self:
+            slot = unit._slot
+            self.occupancy[self.row[slot], self.col[slot]] = -1
+        else:
+            if unit._store is not None:
+                unit._store.release(unit._slot)
+            if len(self.free_slots) == 0:
+                self._grow()
+            slot = self.free_slots.pop()
+            self.units[slot] = unit
+            unit._store = self
+            unit._slot = slot
+            self.alive[slot] = True
+            self.type_id[slot] = self.type_index[type(unit)]
+            self.owner[slot] = self.owner_index[unit.owner]
+            self.health[slot] = unit.health
+            self.fuel[slot] = unit.fuel
+            self.ammo[slot] = unit.ammo
+            self.available[slot] = unit.available
+            self.update_cargo(unit)
+
+        self.row[slot] = r
+        self.col[slot] = c
+        self.occupancy[r, c] = slot
+
+    def remove(self, position):
+        slot = self.occupancy[position[0], position[1]]
+        if slot >= 0:
+            self.release(slot)
+
+    def release(self, slot):
+        unit = self.units[slot]
+        unit._store = None
+        unit._slot = -1
+        self.units[slot] = None
+        self.alive[slot] = False
+        self.cargo[slot] = -1
+        if self.occupancy[self.row[slot], self.col[slot]] == slot:
+            self.occupancy[self.row[slot], self.col[slot]] = -1
+        self.free_slots.append(slot)
+
+    def clear(self):
+        for slot in np.flatnonzero(self.alive).tolist():
+            self.release(slot)
+
+    def update_cargo(self, unit):
+        slot = unit._slot
+        self.cargo[slot] = -1
+        for i, cargo in enumerate(unit.in_load[:MAX_CARGO]):
+            self.cargo[slot, i] = self.type_index[type(cargo)]
+
+    # Copy of the arrays for a cloned state, the units are bound to the copy with rebind
+    def copy(self):
+        new_store = UnitStore.__new__(UnitStore)
+        new_store.__dict__.update(self.__dict__)
+        for name in ["occupancy", "alive", "type_id", "owner", "row", "col", "health", "fuel", "ammo", "available", "cargo"]:
+            setattr(new_store, name, getattr(self, name).copy())
+        new_store.units = [None] * len(self.units)
+        new_store.free_slots = list(self.free_slots)
+        return new_store
+
+    def rebind(self, slot, unit):
+        self.units[slot] = unit
+        unit._store = self
+        unit._slot = slot
+
+    def get_unit_counts(self):
+        return np.bincount(self.owner[self.alive], minlength=len(self.players))
+
+    # Sum of cost scaled by displayed health, per player
+    def get_army_values(self):
+        display_health = -(-self.health[self.alive] // 10)
+        values = self.type_cost[self.type_id[self.alive]] * display_health / 10
+        return np.bincount(self.owner[self.alive], weights=values, minlength=len(self.players))
+
+    # Indices of every unit on the board and their owners, types, rows and columns
+    def get_units_array(self):
+        slots = np.flatnonzero(self.alive)
+        return slots, self.owner[slots], self.type_id[slots], self.row[slots], self.col[slots]
@@ -0,0 +1,74 @@
+import numpy as np
+
+MAX_HEALTH_BUCKET = 10
+MAX_FUEL_BUCKET = 10
+MAX_AMMO = 10
+MAX_CAPTURE = 20
+MAX_CARGO = 2
+
+'''
+Random 64-bit keys for every (position, feature) pair that makes up a game state.
+The hash of a state is the XOR of the keys of its features, so changing a feature only needs
+its old key and its new key XORed into the hash.
+Keys are drawn from a fixed seed, so hashes are stable across processes and runs.
+'''
+class ZobristTable:
+    def __init__(self, height, width, players, unit_classes, seed=0):
+        generator = np.random.default_rng(seed)
+        def keys(*shape):
+            return generator.integers(0, 2**64, size=shape, dtype=np.uint64).tolist()
+
+        size = height * width
+        self.width = width
+        self.owner_index = {player: i for i, player in enumerate(players)}
+        self.unit_index = {unit_class: i for i, unit_class in enumerate(unit_classes)}
+
+        self.unit_keys = keys(size, len(unit_classes), len(players))
+        self.health_keys = keys(size, MAX_HEALTH_BUCKET + 1)
+        self.fuel_keys = keys(size, MAX_FUEL_BUCKET + 1)
+        self.ammo_keys = keys(size, MAX_AMMO + 1)
+        self.available_keys = keys(size)
+        self.cargo_keys = keys(size, MAX_CARGO, len(unit_classes))
+        self.cargo_health_keys = keys(size, MAX_CARGO, MAX_HEALTH_BUCKET + 1)
+        # The last owner slot is for neutral properties
+        self.property_keys = keys(size, len(players) + 1)
+        self.capture_keys = keys(size, MAX_CAPTURE + 1)
+        self.player_keys = keys(len(players))
+        self.cop_keys = keys(len(players))
+        self.scop_keys = keys(len(players))
+
+    def hash_unit(self, position, unit):
+        position_id = position[0] * self.width + position[1]
+        unit_hash = self.unit_keys[position_id][self.unit_index[type(unit)]][self.owner_index[unit.owner]]
+        unit_hash ^= self.health_keys[position_id][unit.get_display_health()]
+        unit_hash ^= self.fuel_keys[position_id][min(MAX_FUEL_BUCKET, unit.fuel // 10)]
+        unit_hash ^= self.ammo_keys[position_id][min(MAX_AMMO, unit.ammo)]
+        if unit.available:
+            unit_hash ^= self.available_keys[position_id]
+        for slot, cargo in enumerate(unit.in_load[:MAX_CARGO]):
+            unit_hash ^= self.cargo_keys[position_id][slot][self.unit_index[type(cargo)]]
+            unit_hash ^= self.cargo_health_keys[position_id][slot][cargo.get_display_health()]
+        return unit_hash
+
+    def hash_property(self, position, property):
+        position_id = position[0] * self.width + position[1]
+        owner = self.owner_index.get(property.owner, len(self.owner_index))
+        return self.property_keys[position_id][owner] ^ self.capture_keys[position_id][int(property.capture_amount)]
+
+    def hash_players(self, current_player, cos):
+        players_hash = self.player_keys[current_player]
+        for player, co in cos.items():
+            if co.cop_applied:
+                players_hash ^= self.cop_keys[self.owner_index[player]]
+            if co.scop_applied:
+                players_hash ^= self.scop_keys[self.owner_index[player]]
+        return players_hash
+
+_tables = {}
+
+# Tables only depend on the map size, players and units, so states of the same map share one
+def get_zobrist_table(height, width, players, unit_classes):
+    key = (height, width, tuple(players), tuple(unit_classes))
+    if key not in _tables:
+        _tables[key] = ZobristTable(height, width, players, unit_classes)
+    return _tables[key]
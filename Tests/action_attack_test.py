@@ -1,4 +1,8 @@
 from Game.Action import ActionAttack, ActionMove
+from Game.CO import BaseCO
+from Game.Unit import standard_units
+from util import calculate_damage, calculate_damage_batch, unit_type_index, attack_allowed_matrix
+import numpy as np
 import pytest
 
 # Test attacking
@@ -157,4 +161,60 @@ def test_cannot_attack_with_primary_if_no_ammo(generate_test_game, unit_library)
 
 #TODO: Can use secondary on valid targets if primary is out of ammo
 
-#TODO: Using secondary does not consume ammo
\ No newline at end of file
+#TODO: Using secondary does not consume ammo
+
+# Only comm towers add to attack
+def test_comm_tower_count(generate_test_game):
+    units = {
+        (0, 0): ("INF", "O"), 
+        (0, 1): ("INF", "B")
+    }
+    terrain = [["OCM", "PLN", "OCT", "OCM", "BCT"]]
+    
+    game = generate_test_game(terrain=terrain, units=units)
+    
+    attack_action = ActionAttack(ActionMove(unit_position=(0, 0), offset=(0, 0)), attack_offset=(0, 1))
+    game.execute_action(attack_action)
+
+    assert attack_action.attacking_CT == 2
+    assert attack_action.defending_CT == 0
+
+# Batch damage matches calculate_damage for every attacking pair, with per pair healths and CO modifiers
+def test_calculate_damage_batch(unit_library, terrain_library):
+    class ModifiedCO(BaseCO):
+        luck = 0
+        def get_attack_modifier(self, unit_type):
+            return 100 + 10 * (unit_type_index[unit_type] % 4)
+        def get_defense_modifier(self, unit_type):
+            return 90 + 10 * (unit_type_index[unit_type] % 3)
+        def get_luck_roll(self):
+            return self.luck
+
+    co = ModifiedCO()
+    unit_count = len(standard_units)
+    attacker_types = np.arange(unit_count)[:, None]
+    defender_types = np.arange(unit_count)[None, :]
+    co_attack = np.array([co.get_attack_modifier(unit_class) for unit_class in standard_units])[:, None]
+    co_defense = np.array([co.get_defense_modifier(unit_class) for unit_class in standard_units])[None, :]
+    rng = np.random.default_rng(0)
+    for terrain_code in ["PLN", "WOD", "MTN"]:
+        terrain = terrain_library.create(terrain_code)
+        attacker_health = rng.integers(1, 11, size=(unit_count, unit_count))
+        defender_health = rng.integers(1, 11, size=(unit_count, unit_count))
+        damages = calculate_damage_batch(attacker_types, defender_types, attacker_health, defender_health, terrain.defense, co_attack, co_defense, CT=1, luck=7)
+        expected_damages = calculate_damage_batch(attacker_types, defender_types, attacker_health, defender_health, terrain.defense, co_attack, co_defense, CT=1, expected=True)
+
+        assert (damages[~attack_allowed_matrix] == 0).all()
+        for a, d in zip(*np.nonzero(attack_allowed_matrix)):
+            attacker = unit_library.create(standard_units[a].code, "O")
+            defender = unit_library.create(standard_units[d].code, "B")
+            attacker.health = int(attacker_health[a, d]) * 10
+            defender.health = int(defender_health[a, d]) * 10
+
+            co.luck = 7
+            assert damages[a, d] == calculate_damage(co, attacker, co, defender, terrain.defense, 1)
+            rolls = []
+            for luck in range(10):
+                co.luck = luck
+                rolls.append(calculate_damage(co, attacker, co, defender, terrain.defense, 1))
+            assert expected_damages[a, d] == pytest.approx(sum(rolls) / 10)
@@ -1,5 +1,7 @@
 from Game.Game import Game
 from Game.CO import BaseCO
+from Game.CompiledMap import CompiledMap, MapRegistry
+from Game.Action import ActionEnd, ActionMove, ActionBuild, ActionDirectAttack
 
 import json
 
@@ -21,3 +23,116 @@ def test_load_tiny_test(base_cos):
             print(specified_position, owner)
             assert game.state.get_unit(specified_position, owner=owner) is not None
             assert game.state.get_unit(specified_position, owner=owner).code == specified_unit_code
+
+# Compiled maps are cached on disk and load back identically
+def test_compiled_map_cache(base_cos, terrain_library, tmp_path):
+    registry = MapRegistry(cache_dir=tmp_path)
+    compiled_map = registry.get("Maps/Tiny_Test.json", terrain_library)
+    cache_dirs = list(tmp_path.glob("Tiny_Test_*"))
+    assert len(cache_dirs) == 1
+    assert cache_dirs[0].stat().st_mode & 0o777 == 0o755
+    assert registry.get("Maps/Tiny_Test.json", terrain_library) is compiled_map
+
+    cached_map = CompiledMap.load(cache_dirs[0])
+    assert cached_map.terrain_codes.tolist() == compiled_map.terrain_codes.tolist()
+    assert cached_map.unit_codes.tolist() == compiled_map.unit_codes.tolist()
+    assert cached_map.unit_positions.tolist() == compiled_map.unit_positions.tolist()
+    for move_type, costs in compiled_map.move_costs.items():
+        assert (cached_map.move_costs[move_type] == costs).all()
+        assert not costs.flags.writeable
+
+    game = Game.load_map(base_cos, "Maps/Tiny_Test.json")
+    assert game.state.get_movement_cost((0, 0), (0, 1), game.state.get_unit((0, 0))) == 1
+
+# An unreadable cache falls back to compiling the map in memory
+def test_map_registry_unreadable_cache(tmp_path, terrain_library, monkeypatch):
+    MapRegistry(cache_dir=tmp_path).get("Maps/Tiny_Test.json", terrain_library)
+
+    def unreadable(path):
+        raise PermissionError(f"Permission denied: {path}")
+    monkeypatch.setattr(CompiledMap, "load", unreadable)
+    compiled_map = MapRegistry(cache_dir=tmp_path).get("Maps/Tiny_Test.json", terrain_library)
+    assert len(compiled_map.unit_codes) > 0
+    assert not compiled_map.move_costs_array.flags.writeable
+    for costs in compiled_map.move_costs.values():
+        assert not costs.flags.writeable
+
+# Actions can be undone and redone from the recorded deltas
+def test_undo_redo(generate_state):
+    terrain = [["PLN", "PLN", "OBS"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = Game(players=["O", "B"], init_state=generate_state(terrain=terrain, units=units), save_history=True)
+    infantry = game.state.get_unit((0, 0))
+    enemy = game.state.get_unit((0, 1))
+
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(0, 0), offset=(0, 0)), (0, 1)))
+    game.execute_action(ActionBuild((0, 2), "INF"))
+    attacked_health = enemy.health
+    assert len(game.history) == 2
+
+    assert game.undo()
+    assert game.state.get_unit((0, 2)) is None
+    assert game.state.funds["O"] == 100000
+    assert game.undo()
+    assert not game.undo()
+    assert enemy.health == 100
+    assert infantry.available
+
+    assert game.redo()
+    assert enemy.health == attacked_health
+    assert not infantry.available
+
+    # Executing a new action discards the undone actions
+    game.execute_action(ActionEnd())
+    assert len(game.history) == 2
+    assert not game.redo()
+    assert game.state.get_current_player() == "B"
+    assert game.undo()
+    assert game.state.get_current_player() == "O"
+
+# The incrementally updated hash matches a hash computed from scratch
+def test_zobrist_hash(generate_state):
+    terrain = [["NCT", "PLN", "OBS"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = Game(players=["O", "B"], init_state=generate_state(terrain=terrain, units=units), save_history=True)
+    initial_hash = game.state.zobrist_hash
+
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(0, 0), offset=(0, 0)), (0, 1)))
+    game.execute_action(ActionBuild((0, 2), "INF"))
+    game.execute_action(ActionEnd())
+    assert game.state.zobrist_hash != initial_hash
+    assert game.state.zobrist_hash == game.state.compute_hash()
+
+    while game.undo():
+        pass
+    assert game.state.zobrist_hash == initial_hash
+    assert game.state.compute_hash() == initial_hash
+
+# Executed and undone actions record the cells and scalars they changed until drained
+def test_change_tracking(generate_state):
+    terrain = [["PLN", "PLN", "OBS", "PLN"]]
+    units = {(0, 0): ("INF", "O"), (0, 3): ("INF", "B")}
+    game = Game(players=["O", "B"], init_state=generate_state(terrain=terrain, units=units), save_history=True)
+    assert game.state.drain_changes().full
+    assert game.state.drain_changes().is_empty()
+
+    game.execute_action(ActionMove(unit_position=(0, 0), offset=(0, 1)))
+    changes = game.state.drain_changes()
+    assert not changes.full
+    assert changes.cells == {(0, 0), (0, 1)}
+    assert changes.units == {(0, 0), (0, 1)}
+    assert changes.properties == set()
+    assert changes.scalars == set()
+
+    game.execute_action(ActionBuild((0, 2), "INF"))
+    changes = game.state.drain_changes()
+    assert changes.cells == {(0, 2)}
+    assert changes.properties == {(0, 2)}
+    assert changes.scalars == {"funds"}
+
+    game.execute_action(ActionEnd())
+    game.undo()
+    changes = game.state.drain_changes()
+    assert changes.cells == {(0, 3)}
+    assert changes.scalars == {"current_player"}
+    assert game.state.clone().drain_changes().full
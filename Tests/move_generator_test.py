@@ -0,0 +1,117 @@
+from Game.Action import ActionEnd, ActionMoveCombineLoad, ActionDirectAttack, ActionIndirectAttack, ActionCapture, ActionBuild, ActionRepair, ActionUnload, ActionCOP, ActionSCOP
+from Game.MoveGenerator import LegalAction, legal_actions, has_legal_action, create_action, EnemyIndex, ring_offsets
+from Game.Unit import UnitInfantry, standard_units
+from Game.CO import COAdder
+
+import pytest
+
+terrain = [
+    ["OBS", "PLN", "PLN", "NCT"],
+    ["PLN", "PLN", "PLN", "PLN"],
+    ["SEA", "PLN", "PLN", "PLN"],
+]
+units = {
+    (0, 1): ("INF", "O"),
+    (1, 1): ("APC", "O"),
+    (1, 3): ("ATY", "O"),
+    (2, 2): ("TNK", "B"),
+}
+
+# Every generated action passes validate
+def test_generated_actions_are_valid(generate_test_game):
+    game = generate_test_game(terrain=terrain, units=units)
+    actions = list(legal_actions(game.state))
+    action_types = {action.action_type for action in actions}
+    assert {ActionEnd, ActionMoveCombineLoad, ActionDirectAttack, ActionIndirectAttack, ActionCapture, ActionBuild, ActionRepair} <= action_types
+
+    for legal_action in actions:
+        action = create_action(legal_action)
+        assert action.validate(game.state), f"{action}: {action.invalid_message}"
+
+    # A piperunner on a base cannot stay on its own space, so it cannot fire from there
+    game = generate_test_game(terrain=[["OBS", "PLN", "PLN", "PLN"]], units={(0, 0): ("PRN", "O"), (0, 3): ("INF", "B")})
+    actions = list(legal_actions(game.state))
+    assert all(action.action_type is not ActionIndirectAttack for action in actions)
+    for legal_action in actions:
+        action = create_action(legal_action)
+        assert action.validate(game.state), f"{action}: {action.invalid_message}"
+
+# Every action that passes validate, found by trying each action type on every space of the board
+def validated_actions(state):
+    spaces = [(r, c) for r in range(state.map_height) for c in range(state.map_width)]
+    candidates = [LegalAction(action_type, None, None, None, None) for action_type in (ActionEnd, ActionCOP, ActionSCOP)]
+    for position in state.get_all_properties():
+        candidates += [LegalAction(ActionBuild, position, None, None, unit_class) for unit_class in standard_units]
+    for position, unit in state.get_all_units().items():
+        for destination in spaces:
+            candidates.append(LegalAction(ActionMoveCombineLoad, position, destination, None, None))
+            candidates.append(LegalAction(ActionCapture, position, destination, None, None))
+            for target in spaces:
+                candidates.append(LegalAction(ActionDirectAttack, position, destination, target, None))
+                candidates.append(LegalAction(ActionRepair, position, destination, target, None))
+                candidates += [LegalAction(ActionUnload, position, destination, target, idx) for idx in range(len(unit.in_load))]
+        candidates += [LegalAction(ActionIndirectAttack, position, position, target, None) for target in spaces]
+    return {candidate for candidate in candidates if create_action(candidate).validate(state)}
+
+# Every action that passes validate is generated, including unloads, indirect attacks and CO powers
+def test_generated_actions_are_complete(generate_test_game):
+    cos = {"O": COAdder(), "B": COAdder()}
+    cos["O"].power = cos["O"].scop_amount
+    game = generate_test_game(co=cos, terrain=terrain, units=units)
+    game.state.get_unit((2, 2)).health = 45
+    assert set(legal_actions(game.state)) == validated_actions(game.state)
+
+    # Load the infantry into the APC, then the other side's turn
+    game.execute_action(create_action(LegalAction(ActionMoveCombineLoad, (0, 1), (1, 1), None, None)))
+    assert game.state.get_unit((1, 1)).in_load
+    assert set(legal_actions(game.state)) == validated_actions(game.state)
+    game.execute_action(ActionEnd())
+    assert set(legal_actions(game.state)) == validated_actions(game.state)
+
+    cos = {"O": COAdder(), "B": COAdder()}
+    game = generate_test_game(co=cos, terrain=[["OBS", "PLN", "PLN", "PLN"]], units={(0, 0): ("PRN", "O"), (0, 3): ("INF", "B")})
+    assert set(legal_actions(game.state)) == validated_actions(game.state)
+
+# Unloading is generated for loaded units
+def test_generated_unload(generate_test_game):
+    game = generate_test_game(terrain=terrain, units=units)
+    game.execute_action(create_action(next(legal_actions(game.state, positions=[(0, 1)], action_types=[ActionMoveCombineLoad]))))
+    assert game.state.get_unit((1, 1)).in_load
+    unloads = list(game.state.legal_actions(positions=[(1, 1)], action_types=[ActionUnload]))
+    assert len(unloads) > 0
+    for legal_action in unloads:
+        action = create_action(legal_action)
+        assert action.validate(game.state), f"{action}: {action.invalid_message}"
+        assert type(action.unloaded_unit) is UnitInfantry
+
+# Filters and limits narrow down the stream
+def test_legal_action_filters(generate_test_game):
+    game = generate_test_game(terrain=terrain, units=units)
+    state = game.state
+
+    infantry_actions = list(legal_actions(state, positions=[(0, 1)]))
+    assert len(infantry_actions) > 0
+    assert all(action.position == (0, 1) for action in infantry_actions)
+
+    builds = list(legal_actions(state, action_types=[ActionBuild]))
+    assert len(builds) > 0
+    assert all(action.action_type is ActionBuild for action in builds)
+
+    assert len(list(legal_actions(state, limit=3))) == 3
+    assert has_legal_action(state, action_types=[ActionIndirectAttack])
+    assert not has_legal_action(state, positions=[(2, 2)])
+
+# Targets in range are the same whether found from the rings or from the target list
+def test_enemy_index_targets_in_range(unit_library):
+    enemy_units = {(r, c): unit_library.create("INF" if (r + c) % 3 else "FGT", "B") for r in range(9) for c in range(9) if (r, c) != (4, 4)}
+    rocket = unit_library.create("ROK", "O")
+    enemy_index = EnemyIndex(enemy_units)
+
+    targets = enemy_index.get_targets(rocket)
+    assert all(type(enemy_units[target]) in rocket.attack_table for target in targets)
+    expected = sorted(target for target in targets if abs(target[0] - 4) + abs(target[1] - 4) in rocket.range)
+    assert sorted(enemy_index.get_targets_in_range((4, 4), rocket)) == expected
+
+    few_enemies = EnemyIndex({target: enemy_units[target] for target in [(0, 0), (4, 7), (1, 4)]})
+    assert sorted(few_enemies.get_targets_in_range((4, 4), rocket)) == [(1, 4), (4, 7)]
+    assert len(ring_offsets(3)) == 12
@@ -2,7 +2,7 @@ from Game.State import State
 from Game.CO import BaseCO
 from Game.Terrain import TerrainLibrary, standard_terrain, Property
 from Game.Unit import UnitLibrary, standard_units
-from Game.Action import ActionEnd
+from Game.Action import ActionEnd, ActionMove, ActionMoveCombineLoad, ActionCapture, ActionBuild, ActionDirectAttack, ActionUnload
 
 import pytest
 import math
@@ -224,6 +224,19 @@ def test_get_terrain_returns_properties(generate_test_game):
 
             assert created_terrain_code == terrain[r][c]
 
+# Terrain defense comes from the library's defense table
+def test_get_terrain_defense(generate_test_game):
+    terrain = [
+        ['PLN', 'MTN', 'WOD', 'RVR', 'ROD'],
+        ['SEA', 'SHL', 'REF', 'OHQ', 'NCT']
+    ]
+
+    game = generate_test_game(terrain=terrain)
+
+    for r in range(len(terrain)):
+        for c in range(len(terrain[0])):
+            assert game.state.get_terrain_defense((r, c)) == game.state.get_terrain((r, c)).defense
+
 # Can get property at position for any owner
 def test_get_property_at_position_no_owner(generate_test_game):
     terrain = [
@@ -312,9 +325,252 @@ def test_get_shortest_path(generate_test_game):
     game = generate_test_game(terrain=terrain, units=units)
     path = game.state.get_shortest_path((0, 1), (2, 1), game.state.get_unit((0, 1)))
     assert path == [1, 3, 5]
+
+# Shortest path goes around enemy units
+def test_get_shortest_path_avoids_enemy_units(generate_test_game):
+    terrain = [
+        ["PLN", "PLN", "PLN"],
+        ["PLN", "PLN", "PLN"],
+    ]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    path = game.state.get_shortest_path((0, 0), (0, 2), game.state.get_unit((0, 0)))
+    assert path == [0, 3, 4, 5, 2]
+
+# Path trees are reused until the enemy blocking the way is destroyed
+def test_shortest_path_tree_cache(generate_test_game):
+    terrain = [
+        ["PLN", "PLN", "PLN"],
+        ["PLN", "PLN", "PLN"],
+    ]
+    units = {(0, 0): ("INF", "O"), (1, 1): ("TNK", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    state = game.state
+    infantry = state.get_unit((0, 0))
+    assert state.get_shortest_path((0, 0), (0, 2), infantry) == [0, 3, 4, 5, 2]
+    tree = state.get_path_tree((0, 0), infantry)
+    assert state.get_path_tree((0, 0), infantry) is tree
+
+    state.get_unit((0, 1)).change_health(-99)
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(1, 1), offset=(0, 0)), (-1, 0)))
+    assert state.get_path_tree((0, 0), infantry) is not tree
+    assert state.get_shortest_path((0, 0), (0, 2), infantry) == [0, 1, 2]
     
-# TODO: Test movement cost updating
+# Movement cost is the cheapest route that avoids enemy units
+def test_movement_cost_avoids_enemy_units(generate_test_game):
+    terrain = [
+        ["PLN", "PLN", "PLN"],
+        ["PLN", "PLN", "PLN"]
+    ]
+    units = {(0, 0): ("REC", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    unit = game.state.get_unit((0, 0))
+    assert game.state.get_movement_cost((0, 0), (0, 2), unit) == 8
+    assert game.state.get_movement_cost((0, 0), (0, 1), unit) == 100
+
+# Reachable spaces are bounded by the unit's move range
+def test_unblocked_spaces_bounded_by_move(generate_test_game):
+    terrain = [["PLN", "PLN", "PLN", "PLN", "PLN"]]
+    units = {(0, 0): ("INF", "O")}
+    game = generate_test_game(terrain=terrain, units=units)
+    assert game.state.get_reachable_spaces((0, 0)) == {(0, 0): 0, (0, 1): 1, (0, 2): 2, (0, 3): 3}
+
+# Killing a blocking unit only refreshes nearby units and matches a full recompute
+def test_refresh_movement_cost_after_kill(generate_test_game):
+    terrain = [["PLN"] * 12]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("TNK", "O"), (0, 2): ("INF", "B"), (0, 11): ("INF", "O")}
+    game = generate_test_game(terrain=terrain, units=units)
+    state = game.state
+    state.get_unit((0, 2)).change_health(-99)
+    far_spaces = state.get_reachable_spaces((0, 11))
+
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(0, 1), offset=(0, 0)), (0, 1)))
+    assert state.get_unit((0, 2)) is None
+    assert state.get_movement_cost((0, 0), (0, 3), state.get_unit((0, 0))) == 3
+    assert state.get_reachable_spaces((0, 11)) is far_spaces
+
+    refreshed = {position: state.get_reachable_spaces(position) for position in [(0, 0), (0, 11)]}
+    state.update_movement_cost()
+    for position in [(0, 0), (0, 11)]:
+        assert refreshed[position] == state.get_reachable_spaces(position)
+
+# Restoring a snapshot undoes every change made after it
+def test_snapshot_restore(generate_test_game):
+    terrain = [["NCT", "PLN", "OBS"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    snapshot = game.state.snapshot()
+    infantry = game.state.get_unit((0, 0))
+
+    game.execute_action(ActionCapture(ActionMove(unit_position=(0, 0), offset=(0, 0))))
+    game.execute_action(ActionBuild((0, 2), "INF"))
+    game.execute_action(ActionEnd())
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(0, 1), offset=(0, 0)), (0, -1)))
+
+    game.state.restore(snapshot)
+
+    assert game.state.get_all_units() == {(0, 0): infantry, (0, 1): game.state.get_unit((0, 1))}
+    assert infantry.health == 100
+    assert infantry.available
+    assert game.state.get_property((0, 0)).capture_amount == 20
+    assert game.state.funds == {"O": 100000, "B": 100000}
+    assert game.state.get_current_player() == "O"
+
+# Clones get their own board and play independently
+def test_clone(generate_test_game):
+    terrain = [["NCT", "PLN", "OBS"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    original = game.state
+    infantry = original.get_unit((0, 0))
+    clone = original.clone()
+    assert clone.get_terrain((0, 1)) is original.get_terrain((0, 1))
+
+    game.state = clone
+    game.execute_action(ActionCapture(ActionMove(unit_position=(0, 0), offset=(0, 0))))
+    game.execute_action(ActionBuild((0, 2), "INF"))
+    game.execute_action(ActionEnd())
+
+    assert clone.get_property((0, 0)).capture_amount == 10
+    assert clone.get_unit((0, 2)) is not None
+    assert clone.get_current_player() == "B"
+
+    # The original keeps its own objects
+    assert original.get_unit((0, 0)) is infantry
+    assert infantry.available
+    assert original.get_property((0, 0)).capture_amount == 20
+    assert original.get_unit((0, 2)) is None
+    assert original.funds == {"O": 100000, "B": 100000}
+    assert original.get_current_player() == "O"
+
+    grandclone = clone.clone()
+    grandclone.get_unit((0, 1)).change_health(-50)
+    assert clone.get_unit((0, 1)).health == 100
+
+# Units taken from the source before cloning do not reach into the clone
+def test_clone_unit_reference(generate_test_game):
+    terrain = [["NCT", "PLN", "OBS"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    original = game.state
+    infantry = original.get_unit((0, 0))
+    city = original.get_property((0, 0))
+
+    clone = original.clone()
+    infantry.change_fuel(-5)
+    city.change_capture("O", -10)
+
+    assert original.get_unit((0, 0)).fuel == 94
+    assert clone.get_unit((0, 0)).fuel == 99
+    assert clone.unit_store.fuel[clone.get_unit((0, 0))._slot] == 99
+    assert original.get_property((0, 0)).capture_amount == 10
+    assert clone.get_property((0, 0)).capture_amount == 20
+
+# The unit store mirrors the units on the board through moves, loads, unloads and attacks
+def test_unit_store(generate_test_game):
+    terrain = [["PLN", "PLN", "PLN", "PLN"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("APC", "O"), (0, 3): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    unit_store = game.state.unit_store
+
+    def assert_store_matches():
+        slots, owners, unit_types, rows, cols = unit_store.get_units_array()
+        assert len(slots) == len(game.state.get_all_units())
+        for slot, owner, unit_type, r, c in zip(slots, owners, unit_types, rows, cols):
+            unit = game.state.get_unit((r, c))
+            assert unit_store.occupancy[r, c] == slot
+            assert unit_store.players[owner] == unit.owner
+            assert unit_store.unit_classes[unit_type] is type(unit)
+            assert (unit_store.health[slot], unit_store.fuel[slot], unit_store.ammo[slot], unit_store.available[slot]) == (unit.health, unit.fuel, unit.ammo, unit.available)
+            assert [unit_store.unit_classes[cargo] for cargo in unit_store.cargo[slot] if cargo >= 0] == [type(cargo) for cargo in unit.in_load]
+        assert (unit_store.occupancy >= 0).sum() == len(slots)
+
+    assert_store_matches()
+    game.execute_action(ActionMoveCombineLoad(ActionMove(unit_position=(0, 0), offset=(0, 1))))
+    assert_store_matches()
+    game.execute_action(ActionMoveCombineLoad(ActionMove(unit_position=(0, 1), offset=(0, 1))))
+    assert_store_matches()
+    game.execute_action(ActionEnd())
+    game.execute_action(ActionEnd())
+    game.execute_action(ActionUnload(ActionMove(unit_position=(0, 2), offset=(0, 0)), unload_offset=(0, -1), idx=0))
+    assert_store_matches()
+    game.execute_action(ActionEnd())
+    game.execute_action(ActionDirectAttack(ActionMove(unit_position=(0, 3), offset=(0, 0)), (0, -1)))
+    assert_store_matches()
+    assert game.state.get_player_stats("O")["unit_count"] == 2
+
+# Per owner lookups follow unit moves, deaths and property captures
+def test_owner_indices(generate_test_game):
+    terrain = [["NCT", "PLN", "BCT"]]
+    units = {(0, 0): ("INF", "O"), (0, 1): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    state = game.state
+
+    assert set(state.get_all_properties("B")) == {(0, 2)}
+    assert set(state.get_all_properties("N")) == {(0, 0)}
+
+    state.get_property((0, 0)).change_capture("O", -20)
+    assert set(state.get_all_properties("O")) == {(0, 0)}
+    assert len(state.get_all_properties("N")) == 0
+
+    infantry = state.get_unit((0, 1))
+    state.remove_unit((0, 1))
+    state.set_unit(infantry, (0, 2))
+    assert state.get_all_units("B") == {(0, 2): infantry}
+    state.remove_unit((0, 2))
+    assert len(state.get_all_units("B")) == 0
+    assert set(state.get_all_units("O")) == {(0, 0)}
+
+# Income follows property captures and is paid at the start of a turn
+def test_income_counter(generate_test_game):
+    terrain = [["OCT", "OLB", "BCT", "NCT"]]
+    game = generate_test_game(terrain=terrain)
+    assert game.state.get_income("O") == 1000
+
+    game.state.get_property((0, 3)).change_capture("B", -20)
+    assert game.state.get_income("B") == 2000
+
+    funds = game.state.funds["B"]
+    game.execute_action(ActionEnd())
+    assert game.state.funds["B"] - funds == 2000
+
+# Units on their own properties are repaired at the start of the turn, in row-major order until funds run out
+def test_turn_start_repairs(generate_test_game, unit_library):
+    terrain = [["BCT", "BCT", "BAP", "PLN"]]
+    units = {
+        (0, 0): unit_library.create("TNK", "B", health=50, ammo=0),
+        (0, 1): unit_library.create("INF", "B", health=50, fuel=10),
+        (0, 2): unit_library.create("INF", "B", health=50),
+        (0, 3): unit_library.create("INF", "B", health=50)
+    }
+    # After 3000 income, funds cover the tank repair but not the infantry repair
+    game = generate_test_game(terrain=terrain, units=units, funds={"O": 0, "B": -1500})
+
+    game.execute_action(ActionEnd())
+
+    tank, infantry, airport_infantry, plain_infantry = [game.state.get_unit((0, c)) for c in range(4)]
+    assert tank.health == 70 and tank.ammo == tank.max_ammo
+    assert infantry.health == 50 and infantry.fuel == infantry.max_fuel
+    assert airport_infantry.health == 50
+    assert plain_infantry.health == 50
+    assert game.state.funds["B"] == 100
+
+
+# Winner is found from HQ, lab and unit counts
+def test_check_winner(generate_test_game):
+    terrain = [["OHQ", "PLN", "BHQ", "BLB"]]
+    units = {(0, 1): ("INF", "O"), (0, 3): ("INF", "B")}
+    game = generate_test_game(terrain=terrain, units=units)
+    state = game.state
+    assert state.check_winner() is None
+
+    state.get_property((0, 2)).change_capture("O", -20)
+    assert state.check_winner() == "O"
+
+    state.get_property((0, 2)).owner = "B"
+    assert state.check_winner() is None
 
-# TODO: Can check if there is a winner
+    state.remove_unit((0, 1))
+    assert state.check_winner() == "B"
 
 # TODO: Can display state as text
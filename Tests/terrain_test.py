@@ -1,9 +1,31 @@
 from Game.State import State
 from Game.CO import BaseCO
-from Game.Terrain import TerrainLibrary, standard_terrain
+from Game.Terrain import TerrainLibrary, Property, standard_terrain
 from Game.Unit import UnitLibrary, standard_units
 from Game.Action import ActionMove
+from Game.MoveType import MoveType
 
 import pytest
 import math
 
+
+# Non-property terrain is shared, properties are created per tile
+def test_terrain_flyweights(terrain_library):
+    assert terrain_library.create("PLN") is terrain_library.create("PLN")
+    assert terrain_library.create("OCT") is not terrain_library.create("OCT")
+
+# Cost and defense tables match the terrain classes
+def test_terrain_tables(terrain_library):
+    for terrain_class, terrain_id in terrain_library.terrain_index.items():
+        assert terrain_library.defense_table[terrain_id] == terrain_class.defense
+        for move_type_id, move_type in enumerate(MoveType):
+            assert terrain_library.move_cost_table[terrain_id, move_type_id] == terrain_class.costs.get(move_type, 0)
+
+# Affordable buildables are exactly the buildables within funds
+def test_affordable_buildables():
+    for terrain_class in [terrain_class for terrain_class in standard_terrain if issubclass(terrain_class, Property)]:
+        assert "buildable_costs" in terrain_class.__dict__
+        for funds in [0, 999, 1000, 7000, 7500, 22000, 100000]:
+            affordable = terrain_class.get_affordable_buildables(funds)
+            assert set(affordable) == {unit_type for unit_type in terrain_class.buildables if unit_type.cost <= funds}
+            assert [unit_type.cost for unit_type in affordable] == sorted(unit_type.cost for unit_type in affordable)
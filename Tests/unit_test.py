@@ -7,3 +7,15 @@ from Game.Action import ActionMove
 import pytest
 import math
 
+
+# Unit stats live on the class, instances only hold the fields that change
+def test_units_share_class_stats(unit_library):
+    infantry = unit_library.create("INF", "O")
+    other_infantry = unit_library.create("INF", "B")
+
+    assert not hasattr(infantry, "__dict__")
+    assert infantry.attack_table is other_infantry.attack_table
+    assert infantry.move == type(infantry).base_move
+
+    infantry.move += 1
+    assert other_infantry.move == type(other_infantry).base_move
@@ -6,6 +6,8 @@ import numpy as np
 
 from Game.Game import Game
 from Game.CO import BaseCO, COAdder
+from Game.CompiledMap import map_registry
+from Game.Terrain import TerrainLibrary, standard_terrain
 from Agent import AIAgent, RandomAgent
 from AWEnv_Gym import AWEnv_Gym
 from SelfplayCallback import SelfplayCallback
@@ -73,6 +75,9 @@ if __name__ == "__main__":
         'opponent_list': current_opponents,
         'reward_type': args.reward_type
     }
+    # Compile the map before creating envs so every worker memory-maps the same read-only arrays
+    map_registry.get(args.map_name, TerrainLibrary(list(env_config['co_cls'].keys()), standard_terrain))
+
     env = make_vec_env(
         env_id=AWEnv_Gym.selfplay_env,
         n_envs=args.n_envs,
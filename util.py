@@ -1,6 +1,5 @@
 import os
 import sys
-import json
 import math
 import numpy as np
 from collections import OrderedDict
@@ -25,7 +24,7 @@ def parse_direction_reverse(direction_input):
     }
     return direction_map.get(direction_input)
 
-def calculate_damage(attacking_co, attacking_unit, defending_co, defending_unit, terrain, CT):
+def calculate_damage(attacking_co, attacking_unit, defending_co, defending_unit, terrain_stars, CT):
     base_damage = attacking_unit.attack_table.get(type(defending_unit), ())[0]
     if base_damage is None:
         raise Exception("{attacker} cannot attack {defender}".format(attacker=attacking_unit, defender=defending_unit))
@@ -33,7 +32,6 @@ def calculate_damage(attacking_co, attacking_unit, defending_co, defending_unit,
     luck = attacking_co.get_luck_roll()
     attacker_visual_health = attacking_unit.get_display_health()
     co_defense = defending_co.get_defense_modifier(type(defending_unit))
-    terrain_stars = terrain.defense
     defender_visual_health = defending_unit.get_display_health()
     ct_attack = CT * 10
 
@@ -43,19 +41,36 @@ def calculate_damage(attacking_co, attacking_unit, defending_co, defending_unit,
     final_damage = math.floor(final_damage)
     return final_damage
 
-def load_map(map_path, terrain_library, unit_library):
-    with open(map_path, 'r+') as map_file:
-        map_data = json.loads(map_file.read())
-        
-        terrain = [[terrain_library.create(tile) for tile in row] for row in map_data["terrain"]]
-        
-        units = { 
-            (unit_data["row"], unit_data["col"]) : unit_library.create(unit_data["code"], owner)
-            for owner, unit_list in map_data['units'].items()
-            for unit_data in unit_list
-        }
-        
-    return terrain, units
+# Attack tables of standard_units as (attacker type x defender type) matrices, indexed through unit_type_index
+unit_type_index = {unit_class: i for i, unit_class in enumerate(standard_units)}
+attack_allowed_matrix = np.array([[defender in attacker.attack_table for defender in standard_units] for attacker in standard_units], dtype=bool)
+base_damage_matrix = np.array([[attacker.attack_table.get(defender, (0, 0))[0] for defender in standard_units] for attacker in standard_units], dtype=np.float64)
+ammo_used_matrix = np.array([[attacker.attack_table.get(defender, (0, 0))[1] for defender in standard_units] for attacker in standard_units], dtype=np.int32)
+
+'''
+calculate_damage over arrays, all arguments broadcast against each other.
+Types are indices from unit_type_index, healths are display healths (1-10) and modifiers are the CO percentages.
+luck is the luck roll, with expected=True the damage is averaged over every roll instead.
+Pairs that cannot attack deal 0 damage, attack_allowed_matrix tells them apart.
+'''
+def calculate_damage_batch(attacker_types, defender_types, attacker_health, defender_health, terrain_stars, co_attack=100, co_defense=100, CT=0, luck=0, expected=False):
+    attacker_types = np.asarray(attacker_types)
+    defender_types = np.asarray(defender_types)
+    if expected:
+        ndim = np.broadcast(attacker_types, defender_types, attacker_health, defender_health, terrain_stars, co_attack, co_defense, CT).ndim
+        luck = np.arange(10).reshape((10,) + (1,) * ndim)
+
+    base_damage = base_damage_matrix[attacker_types, defender_types]
+    ct_attack = np.asarray(CT) * 10
+
+    final_damage = (((base_damage * (co_attack + ct_attack)) / 100) + luck) * (np.asarray(attacker_health) / 10) * ((200 - (co_defense + (np.asarray(terrain_stars) * defender_health))) / 100)
+
+    final_damage = np.ceil(final_damage / 0.05) * 0.05
+    final_damage = np.floor(final_damage)
+    final_damage = np.where(attack_allowed_matrix[attacker_types, defender_types], final_damage, 0)
+    if expected:
+        final_damage = final_damage.mean(axis=0)
+    return final_damage
 
 def linear_schedule(initial_value: float):
     def func(progress_remaining: float) -> float: